@@ -1,8 +1,20 @@
 """JIRA MCP Server - A portable MCP server for JIRA integration."""
 
+from typing import TYPE_CHECKING, Any
+
 __version__ = "1.0.0"
 __author__ = "scarnyc"
 
-from jira_mcp.server import create_server
+if TYPE_CHECKING:
+    from jira_mcp.server import create_server
 
 __all__ = ["create_server", "__version__"]
+
+
+def __getattr__(name: str) -> Any:
+    """Lazily import the server factory so CLI-only paths skip the MCP/httpx stack."""
+    if name == "create_server":
+        from jira_mcp.server import create_server
+
+        return create_server
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -10,7 +10,38 @@ Examples:
     python -m jira_mcp tools
 """
 
-from jira_mcp.cli import main
+import sys
+
+from jira_mcp import __version__
+
+
+def main() -> None:
+    """Run the CLI, answering ``--version`` and cached ``tools`` without click."""
+    args = sys.argv[1:]
+    if args == ["--version"]:
+        sys.stdout.write(f"jira-mcp-server v{__version__}\n")
+        return
+
+    if args == ["tools"]:
+        from jira_mcp.cli_cache import load_manifest, manifest_fingerprint
+
+        # Only short-circuit when a previous run left a matching manifest;
+        # otherwise the click command resolves the config and writes one
+        manifest = load_manifest(manifest_fingerprint())
+        if manifest is not None:
+            from jira_mcp._tools_manifest import format_tools_listing
+
+            listing = format_tools_listing(
+                manifest.get("enabled_tools", ()),
+                bool(manifest.get("read_only", False)),
+            )
+            sys.stdout.write(f"{listing}\n")
+            return
+
+    from jira_mcp.cli import main as cli_main
+
+    cli_main()
+
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,174 @@
+"""Static tool catalogue and listing used by the CLI.
+
+Kept as plain literals so the compiled ``.pyc`` loads them directly without
+building any containers at call time. Update this file when adding a tool;
+tests/test_tools_manifest.py checks it against the registered tools.
+This module must not import click so ``__main__`` can use it on its fast path.
+"""
+
+import sys
+from collections.abc import Iterable
+
+# Tool categories and descriptions shown by the ``jira-mcp tools`` command
+TOOL_INFO: tuple[tuple[str, tuple[tuple[str, str], ...]], ...] = (
+    (
+        "Issues",
+        (
+            ("jira_get_issue", "Retrieve issue details by key"),
+            ("jira_create_issue", "Create a new issue"),
+            ("jira_update_issue", "Update an existing issue"),
+            ("jira_delete_issue", "Delete an issue"),
+            ("jira_search", "Search issues using JQL"),
+            ("jira_batch_create_issues", "Create multiple issues"),
+            ("jira_batch_get_changelogs", "Get issue changelogs"),
+        ),
+    ),
+    (
+        "Comments",
+        (
+            ("jira_add_comment", "Add a comment to an issue"),
+            ("jira_get_comments", "Get comments for an issue"),
+        ),
+    ),
+    (
+        "Transitions",
+        (
+            ("jira_get_transitions", "Get available transitions"),
+            ("jira_transition_issue", "Transition an issue to a new status"),
+        ),
+    ),
+    (
+        "Projects",
+        (
+            ("jira_get_all_projects", "List all accessible projects"),
+            ("jira_get_project_issues", "Get issues for a project"),
+        ),
+    ),
+    (
+        "Boards",
+        (
+            ("jira_get_agile_boards", "List agile boards"),
+            ("jira_get_board_issues", "Get issues on a board"),
+        ),
+    ),
+    (
+        "Sprints",
+        (
+            ("jira_get_sprints_from_board", "Get sprints for a board"),
+            ("jira_get_sprint_issues", "Get issues in a sprint"),
+            ("jira_create_sprint", "Create a new sprint"),
+            ("jira_update_sprint", "Update a sprint"),
+        ),
+    ),
+    (
+        "Epics",
+        (
+            ("jira_link_to_epic", "Link an issue to an epic"),
+            ("jira_get_epic_issues", "Get issues in an epic"),
+        ),
+    ),
+    (
+        "Links",
+        (
+            ("jira_get_link_types", "Get available link types"),
+            ("jira_create_issue_link", "Create a link between issues"),
+            ("jira_remove_issue_link", "Remove a link between issues"),
+            ("jira_create_remote_issue_link", "Create an external link"),
+        ),
+    ),
+    (
+        "Worklogs",
+        (
+            ("jira_add_worklog", "Log time on an issue"),
+            ("jira_get_worklog", "Get worklogs for an issue"),
+        ),
+    ),
+    (
+        "Versions",
+        (
+            ("jira_get_project_versions", "Get versions for a project"),
+            ("jira_create_version", "Create a new version"),
+            ("jira_batch_create_versions", "Create multiple versions"),
+        ),
+    ),
+    (
+        "Attachments",
+        (
+            ("jira_download_attachments", "Download attachments"),
+            ("jira_add_attachment", "Add an attachment to an issue"),
+        ),
+    ),
+    (
+        "Users",
+        (
+            ("jira_get_user_profile", "Get user profile"),
+            ("jira_search_users", "Search for users"),
+        ),
+    ),
+    (
+        "Fields",
+        (
+            ("jira_search_fields", "Search for field definitions"),
+        ),
+    ),
+)
+
+# Tools that modify JIRA data (disabled in read-only mode)
+WRITE_TOOLS: frozenset[str] = frozenset(
+    (
+        "jira_create_issue",
+        "jira_update_issue",
+        "jira_delete_issue",
+        "jira_batch_create_issues",
+        "jira_add_comment",
+        "jira_transition_issue",
+        "jira_create_sprint",
+        "jira_update_sprint",
+        "jira_link_to_epic",
+        "jira_create_issue_link",
+        "jira_remove_issue_link",
+        "jira_create_remote_issue_link",
+        "jira_add_worklog",
+        "jira_create_version",
+        "jira_batch_create_versions",
+        "jira_add_attachment",
+    )
+)
+
+
+def format_tools_listing(enabled_tools: Iterable[str], read_only: bool) -> str:
+    """Render the ``jira-mcp tools`` output.
+
+    Args:
+        enabled_tools: Names of enabled tools (empty = all tools)
+        read_only: Whether write tools are disabled
+
+    Returns:
+        Listing text, without a trailing newline
+    """
+    enabled = frozenset(map(sys.intern, enabled_tools))
+
+    lines: list[str] = ["Available JIRA MCP Tools:\n"]
+
+    total_tools = 0
+    for category, tools_list in TOOL_INFO:
+        lines.append(f"  {category}:")
+        for tool_name, description in tools_list:
+            total_tools += 1
+            status = ""
+
+            # Check if tool is disabled
+            if enabled and tool_name not in enabled:
+                status = " [DISABLED]"
+            elif read_only and tool_name in WRITE_TOOLS:
+                status = " [READ-ONLY]"
+
+            lines.append(f"    - {tool_name}: {description}{status}")
+        lines.append("")
+
+    lines.append(f"Total: {total_tools} tools")
+
+    if read_only:
+        lines.append("\nNote: Write operations are disabled (read-only mode)")
+
+    return "\n".join(lines)
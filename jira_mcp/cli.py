@@ -1,28 +1,87 @@
 """CLI interface for JIRA MCP Server."""
 
 import asyncio
+import os
 import sys
-from typing import Optional
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Coroutine, Optional, TypeVar
 
 import click
 
 from jira_mcp import __version__
+from jira_mcp._tools_manifest import format_tools_listing
 from jira_mcp.utils.logging import configure_logging, get_logger
 
+if TYPE_CHECKING:
+    from jira_mcp.config import JiraConfig
+
+T = TypeVar("T")
+
+# Option types shared by the command tree. The click group below is built once
+# at import and reused by every main() call, including repeated in-process runs
+_TRANSPORT_CHOICE = click.Choice(("stdio", "sse"))
+_LOG_LEVEL_CHOICE = click.Choice(("DEBUG", "INFO", "WARNING", "ERROR"))
+
+
+def _env_fingerprint() -> tuple[tuple[str, str], ...]:
+    """Snapshot the JIRA_* environment variables that feed the configuration."""
+    return tuple(
+        sorted((k.upper(), v) for k, v in os.environ.items() if k.upper().startswith("JIRA_"))
+    )
+
+
+def _run_async(coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine to completion, using uvloop when it is installed.
+
+    Args:
+        coro: Coroutine to run
+
+    Returns:
+        The coroutine's result
+    """
+    try:
+        import uvloop
+    except ImportError:
+        uvloop = None  # type: ignore[assignment]
+
+    if sys.version_info >= (3, 11):
+        loop_factory = uvloop.new_event_loop if uvloop is not None else None
+        with asyncio.Runner(debug=False, loop_factory=loop_factory) as runner:
+            return runner.run(coro)
+
+    # 3.10 has no Runner; the policy is the only way to pick the loop
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return asyncio.run(coro)
+
+
+@lru_cache(maxsize=1)
+def _cached_config(env_fingerprint: tuple[tuple[str, str], ...]) -> "JiraConfig":
+    """Load configuration once per distinct JIRA_* environment snapshot.
+
+    Args:
+        env_fingerprint: Result of ``_env_fingerprint()``, used as the cache key
+
+    Returns:
+        JIRA configuration
+    """
+    from jira_mcp.config import get_config
+
+    # The environment changed since the last load - rebuild the singleton
+    return get_config(refresh=True)
+
 
 @click.group(invoke_without_command=True)
-@click.option(
+@click.version_option(
+    __version__,
     "--version",
-    is_flag=True,
+    prog_name="jira-mcp-server",
+    message="%(prog)s v%(version)s",
     help="Show version and exit.",
 )
 @click.pass_context
-def main(ctx: click.Context, version: bool) -> None:
+def main(ctx: click.Context) -> None:
     """JIRA MCP Server - A portable MCP server for JIRA integration."""
-    if version:
-        click.echo(f"jira-mcp-server v{__version__}")
-        sys.exit(0)
-
     # If no subcommand, run the server
     if ctx.invoked_subcommand is None:
         ctx.invoke(serve)
@@ -31,7 +90,7 @@ def main(ctx: click.Context, version: bool) -> None:
 @main.command()
 @click.option(
     "--transport",
-    type=click.Choice(["stdio", "sse"]),
+    type=_TRANSPORT_CHOICE,
     default="stdio",
     help="MCP transport type (default: stdio)",
 )
@@ -48,7 +107,7 @@ def main(ctx: click.Context, version: bool) -> None:
 )
 @click.option(
     "--log-level",
-    type=click.Choice(["DEBUG", "INFO", "WARNING", "ERROR"]),
+    type=_LOG_LEVEL_CHOICE,
     default=None,
     help="Override log level from config",
 )
@@ -66,11 +125,10 @@ def serve(
     read_only: Optional[bool],
 ) -> None:
     """Start the JIRA MCP server."""
-    from jira_mcp.config import get_config
     from jira_mcp.server import create_server
 
     try:
-        config = get_config()
+        config = _cached_config(_env_fingerprint())
     except Exception as e:
         click.echo(f"Configuration error: {e}", err=True)
         click.echo(
@@ -84,17 +142,16 @@ def serve(
     configure_logging(effective_log_level)
     logger = get_logger()
 
-    # Handle read-only override
-    if read_only is not None:
-        # Note: This doesn't modify the cached config, just logs the intent
-        # The actual check happens at tool execution time
-        if read_only:
-            logger.info("Read-only mode enabled via CLI flag")
+    # The CLI flag wins over the config; create_server applies it when it
+    # decides which write tools to register
+    effective_read_only = config.read_only if read_only is None else read_only
+    if read_only:
+        logger.info("Read-only mode enabled via CLI flag")
 
-    logger.info(f"Starting JIRA MCP Server v{__version__}")
-    logger.info(f"JIRA URL: {config.url}")
-    logger.info(f"Transport: {transport}")
-    logger.info(f"Read-only: {config.read_only or read_only}")
+    logger.info("Starting JIRA MCP Server v%s", __version__)
+    logger.info("JIRA URL: %s", config.url)
+    logger.info("Transport: %s", transport)
+    logger.info("Read-only: %s", effective_read_only)
 
     # Create and run server
     mcp = create_server(config, read_only_override=read_only)
@@ -103,15 +160,15 @@ def serve(
         logger.info("Running with stdio transport")
         mcp.run(transport="stdio")
     else:
-        logger.info(f"Running with SSE transport on {host}:{port}")
+        logger.info("Running with SSE transport on %s:%s", host, port)
         mcp.run(transport="sse", host=host, port=port)
 
 
 @main.command()
 def check() -> None:
     """Check JIRA connection and configuration."""
-    from jira_mcp.config import get_config
     from jira_mcp.client import JiraClient
+    from jira_mcp.config import ConfigSnapshot
 
     configure_logging("INFO")
     logger = get_logger()
@@ -119,21 +176,22 @@ def check() -> None:
     click.echo("Checking JIRA configuration...")
 
     try:
-        config = get_config()
-        click.echo(f"  JIRA URL: {config.url}")
-        click.echo(f"  Username: {config.username}")
-        click.echo(f"  Auth method: {'PAT' if config.use_pat else 'API Token'}")
-        click.echo(f"  Cloud instance: {config.is_cloud}")
-        click.echo(f"  Read-only mode: {config.read_only}")
-        click.echo(f"  SSL verification: {config.verify_ssl}")
-        click.echo(f"  Timeout: {config.timeout}s")
+        config = _cached_config(_env_fingerprint())
+        snapshot = ConfigSnapshot.from_config(config)
+        click.echo(f"  JIRA URL: {snapshot.url}")
+        click.echo(f"  Username: {snapshot.username}")
+        click.echo(f"  Auth method: {'PAT' if snapshot.use_pat else 'API Token'}")
+        click.echo(f"  Cloud instance: {snapshot.is_cloud}")
+        click.echo(f"  Read-only mode: {snapshot.read_only}")
+        click.echo(f"  SSL verification: {snapshot.verify_ssl}")
+        click.echo(f"  Timeout: {snapshot.timeout}s")
     except Exception as e:
         click.echo(f"  Configuration error: {e}", err=True)
         sys.exit(1)
 
     click.echo("\nTesting JIRA connection...")
 
-    async def test_connection() -> bool:
+    async def run_checks() -> bool:
         client = JiraClient(config)
         try:
             user = await client.get_current_user()
@@ -145,8 +203,9 @@ def check() -> None:
             return False
         finally:
             await client.close()
+            await JiraClient.close_all()
 
-    success = asyncio.run(test_connection())
+    success = _run_async(run_checks())
 
     if success:
         click.echo("\nConnection successful!")
@@ -159,122 +218,30 @@ def check() -> None:
 @main.command()
 def tools() -> None:
     """List available JIRA tools."""
-    from jira_mcp.config import get_config
-
-    try:
-        config = get_config()
-    except Exception:
-        config = None
-
-    # Tool categories and descriptions
-    tool_info = {
-        "Issues": [
-            ("jira_get_issue", "Retrieve issue details by key"),
-            ("jira_create_issue", "Create a new issue"),
-            ("jira_update_issue", "Update an existing issue"),
-            ("jira_delete_issue", "Delete an issue"),
-            ("jira_search", "Search issues using JQL"),
-            ("jira_batch_create_issues", "Create multiple issues"),
-            ("jira_batch_get_changelogs", "Get issue changelogs"),
-        ],
-        "Comments": [
-            ("jira_add_comment", "Add a comment to an issue"),
-            ("jira_get_comments", "Get comments for an issue"),
-        ],
-        "Transitions": [
-            ("jira_get_transitions", "Get available transitions"),
-            ("jira_transition_issue", "Transition an issue to a new status"),
-        ],
-        "Projects": [
-            ("jira_get_all_projects", "List all accessible projects"),
-            ("jira_get_project_issues", "Get issues for a project"),
-        ],
-        "Boards": [
-            ("jira_get_agile_boards", "List agile boards"),
-            ("jira_get_board_issues", "Get issues on a board"),
-        ],
-        "Sprints": [
-            ("jira_get_sprints_from_board", "Get sprints for a board"),
-            ("jira_get_sprint_issues", "Get issues in a sprint"),
-            ("jira_create_sprint", "Create a new sprint"),
-            ("jira_update_sprint", "Update a sprint"),
-        ],
-        "Epics": [
-            ("jira_link_to_epic", "Link an issue to an epic"),
-            ("jira_get_epic_issues", "Get issues in an epic"),
-        ],
-        "Links": [
-            ("jira_get_link_types", "Get available link types"),
-            ("jira_create_issue_link", "Create a link between issues"),
-            ("jira_remove_issue_link", "Remove a link between issues"),
-            ("jira_create_remote_issue_link", "Create an external link"),
-        ],
-        "Worklogs": [
-            ("jira_add_worklog", "Log time on an issue"),
-            ("jira_get_worklog", "Get worklogs for an issue"),
-        ],
-        "Versions": [
-            ("jira_get_project_versions", "Get versions for a project"),
-            ("jira_create_version", "Create a new version"),
-            ("jira_batch_create_versions", "Create multiple versions"),
-        ],
-        "Attachments": [
-            ("jira_download_attachments", "Download attachments"),
-            ("jira_add_attachment", "Add an attachment to an issue"),
-        ],
-        "Users": [
-            ("jira_get_user_profile", "Get user profile"),
-            ("jira_search_users", "Search for users"),
-        ],
-        "Fields": [
-            ("jira_search_fields", "Search for field definitions"),
-        ],
-    }
-
-    click.echo("Available JIRA MCP Tools:\n")
-
-    enabled_tools = config.enabled_tools_list if config else []
-    read_only = config.read_only if config else False
-
-    write_tools = {
-        "jira_create_issue",
-        "jira_update_issue",
-        "jira_delete_issue",
-        "jira_batch_create_issues",
-        "jira_add_comment",
-        "jira_transition_issue",
-        "jira_create_sprint",
-        "jira_update_sprint",
-        "jira_link_to_epic",
-        "jira_create_issue_link",
-        "jira_remove_issue_link",
-        "jira_create_remote_issue_link",
-        "jira_add_worklog",
-        "jira_create_version",
-        "jira_batch_create_versions",
-        "jira_add_attachment",
-    }
-
-    total_tools = 0
-    for category, tools_list in tool_info.items():
-        click.echo(f"  {category}:")
-        for tool_name, description in tools_list:
-            total_tools += 1
-            status = ""
-
-            # Check if tool is disabled
-            if enabled_tools and tool_name not in enabled_tools:
-                status = " [DISABLED]"
-            elif read_only and tool_name in write_tools:
-                status = " [READ-ONLY]"
-
-            click.echo(f"    - {tool_name}: {description}{status}")
-        click.echo()
-
-    click.echo(f"Total: {total_tools} tools")
+    from jira_mcp.cli_cache import load_manifest, manifest_fingerprint, save_manifest
+    from jira_mcp.config import ConfigSnapshot
 
-    if read_only:
-        click.echo("\nNote: Write operations are disabled (read-only mode)")
+    # Reuse the settings resolved by a previous run when the inputs are unchanged
+    fingerprint = manifest_fingerprint()
+    manifest = load_manifest(fingerprint)
+    if manifest is None:
+        try:
+            snapshot = ConfigSnapshot.from_config(_cached_config(_env_fingerprint()))
+        except Exception:
+            manifest = {"enabled_tools": [], "read_only": False}
+        else:
+            manifest = {
+                "enabled_tools": sorted(snapshot.enabled_tools),
+                "read_only": snapshot.read_only,
+            }
+            save_manifest(fingerprint, manifest)
+
+    click.echo(
+        format_tools_listing(
+            manifest.get("enabled_tools", ()),
+            bool(manifest.get("read_only", False)),
+        )
+    )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,73 @@
+"""On-disk cache of resolved CLI settings, keyed by an environment fingerprint."""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Optional
+
+from jira_mcp import __version__
+
+MANIFEST_PATH = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "jira-mcp" / "manifest.json"
+)
+
+
+def manifest_fingerprint() -> str:
+    """Hash the inputs that determine the resolved configuration.
+
+    Covers all JIRA_* environment variables, the local ``.env`` file and the
+    package version, so any change to them invalidates the manifest.
+
+    Returns:
+        Hex digest identifying the current configuration inputs
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for key, value in sorted(os.environ.items()):
+        if key.upper().startswith("JIRA_"):
+            digest.update(f"{key.upper()}={value}\0".encode())
+    try:
+        digest.update(Path(".env").read_bytes())
+    except OSError:
+        pass
+    digest.update(__version__.encode())
+    return digest.hexdigest()
+
+
+def load_manifest(fingerprint: str) -> Optional[dict[str, Any]]:
+    """Load the cached manifest if it matches the fingerprint.
+
+    Args:
+        fingerprint: Value from ``manifest_fingerprint()``
+
+    Returns:
+        Cached data, or None if missing, stale or unreadable
+    """
+    try:
+        manifest = json.loads(MANIFEST_PATH.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(manifest, dict) or manifest.get("fingerprint") != fingerprint:
+        return None
+    data = manifest.get("data")
+    return data if isinstance(data, dict) else None
+
+
+def save_manifest(fingerprint: str, data: dict[str, Any]) -> None:
+    """Persist the manifest, ignoring filesystem errors.
+
+    Args:
+        fingerprint: Value from ``manifest_fingerprint()``
+        data: JSON-serializable data to cache (must not contain secrets)
+    """
+    try:
+        MANIFEST_PATH.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = MANIFEST_PATH.with_suffix(".tmp")
+        tmp_path.write_text(
+            json.dumps({"fingerprint": fingerprint, "data": data}),
+            encoding="utf-8",
+        )
+        tmp_path.replace(MANIFEST_PATH)
+    except OSError:
+        pass
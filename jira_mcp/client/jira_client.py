@@ -1,17 +1,82 @@
 """JIRA API client with async HTTP requests and retry logic."""
 
 import asyncio
+import copy
+import random
+import re
+import secrets
+import time
+import weakref
+from collections import OrderedDict
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from functools import lru_cache, wraps
 from pathlib import Path
-from typing import Any, Optional
-
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    ClassVar,
+    Optional,
+    TypeVar,
+    Union,
+)
+
+import anyio
 import httpx
 
 from jira_mcp.config import JiraConfig
 from jira_mcp.utils.auth import get_auth_headers
 from jira_mcp.utils.logging import get_logger
+from jira_mcp.utils.serialization import json_dumps, json_loads
 
 logger = get_logger(__name__)
 
+T = TypeVar("T")
+K = TypeVar("K")
+
+try:
+    import h2  # noqa: F401
+
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
+
+# Chunk sizes for streamed attachment uploads and downloads
+_UPLOAD_CHUNK_SIZE = 64 * 1024
+_DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# Maximum number of GET responses kept for ETag revalidation
+_ETAG_CACHE_SIZE = 128
+
+# Maximum number of TTL-cached metadata results
+_TTL_CACHE_SIZE = 256
+
+# Decorrelated-jitter backoff bounds, in seconds
+_BACKOFF_BASE = 1.0
+_BACKOFF_CAP = 30.0
+
+# Longest server-requested Retry-After worth waiting for; beyond it the
+# request fails instead of holding the tool call open
+_MAX_RETRY_AFTER = 60.0
+
+_MAX_AGE_RE = re.compile(r"max-age=(\d+)")
+
+# Cloud API v3 requires explicit fields (new search/jql endpoint doesn't return them by default)
+_DEFAULT_SEARCH_FIELDS = (
+    "summary", "status", "priority", "issuetype", "assignee",
+    "reporter", "created", "updated", "description", "labels",
+    "components", "project", "resolution", "resolutiondate",
+)
+_DEFAULT_SEARCH_FIELDS_JOINED = ",".join(_DEFAULT_SEARCH_FIELDS)
+
+
+@lru_cache(maxsize=64)
+def _join_fields(fields: tuple[str, ...]) -> str:
+    """Join a field list for the ``fields`` query parameter, memoized per tuple."""
+    return ",".join(fields)
+
 
 class JiraAPIError(Exception):
     """Base exception for JIRA API errors."""
@@ -57,6 +122,67 @@ class JiraRateLimitError(JiraAPIError):
     pass
 
 
+# Status codes whose body is returned as parsed JSON
+_SUCCESS_STATUSES = frozenset({200, 201})
+
+# Non-retryable error statuses: exception class and message template
+_ERROR_STATUSES: dict[int, tuple[type[JiraAPIError], str]] = {
+    400: (JiraValidationError, "Validation error: {detail}"),
+    401: (JiraAuthenticationError, "Authentication failed. Check credentials."),
+    403: (JiraPermissionError, "Permission denied. Check user permissions."),
+    404: (JiraNotFoundError, "Resource not found: {url}"),
+}
+
+
+def _ttl_cached(url: str) -> Callable:
+    """Cache a client method's result for a time-to-live.
+
+    The TTL is the ``Cache-Control: max-age`` last sent by the server for
+    ``url``, falling back to ``config.metadata_cache_ttl``. Once an entry
+    expires the call goes back through ``_request``, which revalidates
+    with a conditional GET where the method opts in. Callers get a shallow
+    copy, so they can't alter the cached value.
+
+    Args:
+        url: Resolved request path the method fetches (e.g. ``/rest/api/2/field``)
+
+    Returns:
+        Decorator for async ``JiraClient`` methods
+    """
+
+    def decorator(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+        @wraps(func)
+        async def wrapper(self: "JiraClient", *args: Any, **kwargs: Any) -> T:
+            key = (url, func.__name__, args, frozenset(kwargs.items()))
+            now = time.monotonic()
+            entry = self._ttl_cache.get(key)
+            if entry is not None and entry[0] > now:
+                return copy.copy(entry[1])
+
+            value = await func(self, *args, **kwargs)
+            ttl = self._max_age.get(url, self.config.metadata_cache_ttl)
+            cache = self._ttl_cache
+            cache.pop(key, None)
+            cache[key] = (now + ttl, value)
+            # Per-argument entries (e.g. user searches) would otherwise grow
+            # without bound; drop the least recently stored
+            if len(cache) > _TTL_CACHE_SIZE:
+                del cache[next(iter(cache))]
+            return copy.copy(value)
+
+        return wrapper
+
+    return decorator
+
+
+def _running_loop() -> Optional[asyncio.AbstractEventLoop]:
+    """Return the running event loop, or None when called outside one."""
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
 class JiraClient:
     """Async JIRA API client with retry logic and comprehensive endpoint support.
 
@@ -64,6 +190,13 @@ class JiraClient:
     (JIRA Server/Data Center) authentication.
     """
 
+    # httpx clients shared by every JiraClient with the same connection settings
+    # on the same event loop. Entries disappear once no JiraClient holds the
+    # client, so unclosed instances don't pin the pool (or its loop)
+    _client_cache: ClassVar["weakref.WeakValueDictionary[tuple, httpx.AsyncClient]"] = (
+        weakref.WeakValueDictionary()
+    )
+
     def __init__(self, config: JiraConfig):
         """Initialize JIRA client.
 
@@ -73,25 +206,126 @@ class JiraClient:
         self.config = config
         self.base_url = config.url
         self.headers = get_auth_headers(config)
+
+        # Header variants reused for multipart requests (no JSON content-type)
+        self._upload_headers = {k: v for k, v in self.headers.items() if k != "Content-Type"}
+        self._attachment_headers = {
+            "X-Atlassian-Token": "no-check",
+            "Accept": "application/json",
+        }
+        if "Authorization" in self.headers:
+            self._attachment_headers["Authorization"] = self.headers["Authorization"]
         self.timeout = httpx.Timeout(config.timeout)
 
-        # Create async client
-        self.client = httpx.AsyncClient(
-            base_url=self.base_url,
-            headers=self.headers,
-            timeout=self.timeout,
-            verify=config.verify_ssl,
+        # Endpoint routing resolved once rather than per request
+        self._api_prefix = "/rest/api/2"
+        # Search is the hottest path (paginated loops), so its absolute URL is
+        # parsed once here and handed to httpx as-is, skipping the base_url join.
+        # Cloud must use the new search/jql endpoint (old endpoints deprecated - 410)
+        # See: https://developer.atlassian.com/changelog/#CHANGE-2046
+        root = self.base_url.rstrip("/")
+        self._search_cloud_url = httpx.URL(f"{root}/rest/api/3/search/jql")
+        self._search_server_url = httpx.URL(f"{root}{self._api_prefix}/search")
+        self._search_endpoint = (
+            self._search_cloud_url if config.is_cloud else self._search_server_url
         )
 
+        # LRU of (url, params) -> (ETag, raw body) for conditional GETs. The
+        # body is kept unparsed so every hit hands out a fresh object
+        self._etag_cache: OrderedDict[tuple[str, frozenset], tuple[str, bytes]] = OrderedDict()
+
+        # Time-limited results of rarely-changing metadata calls (see _ttl_cached),
+        # and the Cache-Control max-age last advertised per URL
+        self._ttl_cache: dict[tuple, tuple[float, Any]] = {}
+        self._max_age: dict[str, float] = {}
+
+        # Pending GET requests by (endpoint, params), shared by concurrent callers
+        self._inflight: dict[tuple[str, frozenset, bool], asyncio.Future[dict[str, Any]]] = {}
+
+        # The httpx client is acquired lazily from the shared pool on first
+        # use, once the event loop it will run on is known
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_key: Optional[tuple] = None
+
         logger.info(
-            f"Initialized JIRA client for {self.base_url} "
-            f"(Cloud: {config.is_cloud}, PAT: {config.use_pat})"
+            "Initialized JIRA client for %s (Cloud: %s, PAT: %s, HTTP/2: %s)",
+            self.base_url,
+            config.is_cloud,
+            config.use_pat,
+            config.http2 and _HTTP2_AVAILABLE,
         )
 
+    @classmethod
+    def _get_shared_client(
+        cls, config: JiraConfig, headers: dict[str, str]
+    ) -> tuple[tuple, httpx.AsyncClient]:
+        """Get the pooled httpx client for these settings on the running loop.
+
+        Args:
+            config: JIRA configuration object
+            headers: Default request headers
+
+        Returns:
+            Cache key and shared client
+        """
+        http2 = config.http2 and _HTTP2_AVAILABLE
+        key = (
+            _running_loop(),
+            config.url,
+            frozenset(headers.items()),
+            config.verify_ssl,
+            config.timeout,
+            http2,
+            config.max_connections,
+            config.max_keepalive_connections,
+            config.keepalive_expiry,
+        )
+        client = cls._client_cache.get(key)
+        if client is None or client.is_closed:
+            # The connection pool keeps TCP/TLS connections alive between tool
+            # calls; HTTP/2 (when h2 is installed) multiplexes concurrent
+            # requests over one connection, otherwise HTTP/1.1 is used
+            client = httpx.AsyncClient(
+                base_url=config.url,
+                headers=headers,
+                timeout=httpx.Timeout(config.timeout),
+                verify=config.verify_ssl,
+                limits=httpx.Limits(
+                    max_connections=config.max_connections,
+                    max_keepalive_connections=config.max_keepalive_connections,
+                    keepalive_expiry=config.keepalive_expiry,
+                ),
+                http2=http2,
+            )
+            cls._client_cache[key] = client
+        return key, client
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """HTTP client for the running event loop, shared with other JiraClients."""
+        client, key = self._client, self._client_key
+        if client is None or key is None or client.is_closed or key[0] is not _running_loop():
+            self._client_key, self._client = self._get_shared_client(self.config, self.headers)
+        return self._client
+
     async def close(self) -> None:
-        """Close the HTTP client."""
-        await self.client.aclose()
-        logger.debug("JIRA client closed")
+        """Release this instance's HTTP client.
+
+        The pooled client stays open for other JiraClients on the same loop;
+        call ``close_all()`` at shutdown to close the pool itself.
+        """
+        self._client_key = self._client = None
+        logger.debug("JIRA client released")
+
+    @classmethod
+    async def close_all(cls) -> None:
+        """Close every pooled HTTP client created on the current event loop."""
+        loop = _running_loop()
+        for key, client in list(cls._client_cache.items()):
+            if key[0] is loop or key[0] is None:
+                cls._client_cache.pop(key, None)
+                await client.aclose()
+        logger.debug("JIRA client pool closed")
 
     async def __aenter__(self):
         """Async context manager entry."""
@@ -101,16 +335,35 @@ class JiraClient:
         """Async context manager exit."""
         await self.close()
 
+    def invalidate_metadata(self, url: Optional[str] = None) -> None:
+        """Drop cached metadata so the next calls fetch it from the server again.
+
+        Args:
+            url: Only drop entries cached for this request path
+                (e.g. ``/rest/api/2/field``); all metadata when omitted
+        """
+        if url is None:
+            self._ttl_cache.clear()
+            self._max_age.clear()
+            return
+        for key in [key for key in self._ttl_cache if key[0] == url]:
+            del self._ttl_cache[key]
+        self._max_age.pop(url, None)
+
     async def _request(
         self,
         method: str,
-        endpoint: str,
+        endpoint: Union[str, httpx.URL],
         params: Optional[dict] = None,
         json_data: Optional[dict] = None,
         files: Optional[dict] = None,
-        retry_count: int = 0,
+        revalidate: bool = False,
     ) -> dict[str, Any]:
-        """Make HTTP request with retry logic and error handling.
+        """Make HTTP request, sharing identical in-flight GETs.
+
+        Concurrent GETs for the same endpoint and params await a single
+        underlying request instead of each hitting the server. Each caller
+        gets its own shallow copy of the result.
 
         Args:
             method: HTTP method (GET, POST, PUT, DELETE)
@@ -118,7 +371,7 @@ class JiraClient:
             params: Query parameters
             json_data: JSON request body
             files: Files to upload
-            retry_count: Current retry attempt
+            revalidate: Keep the response for ETag revalidation (GET only)
 
         Returns:
             Response JSON data
@@ -126,122 +379,170 @@ class JiraClient:
         Raises:
             JiraAPIError: If request fails after retries
         """
-        # Handle different endpoint formats:
-        # - Full URLs (http/https) - use as-is
-        # - Full REST paths (/rest/...) - use as-is (for Agile API, etc.)
-        # - Relative paths (/issues/...) - prepend REST API v2 base
-        if endpoint.startswith("http"):
-            url = endpoint
-        elif endpoint.startswith("/rest/"):
-            url = endpoint
-        else:
-            url = f"/rest/api/2{endpoint}"
+        if method != "GET" or files or json_data:
+            return await self._send_request(method, endpoint, params, json_data, files)
+
+        key = (endpoint, frozenset((params or {}).items()), revalidate)
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(
+                self._send_request(method, endpoint, params, revalidate=revalidate)
+            )
+            self._inflight[key] = task
 
-        try:
-            logger.debug(f"{method} {url} (attempt {retry_count + 1})")
+            def _forget(done: "asyncio.Future[dict[str, Any]]") -> None:
+                if self._inflight.get(key) is done:
+                    del self._inflight[key]
+
+            task.add_done_callback(_forget)
 
-            # Prepare request kwargs
-            kwargs: dict[str, Any] = {"params": params}
+        # Shield so one cancelled caller doesn't cancel the request for the others
+        return copy.copy(await asyncio.shield(task))
 
-            if files:
-                # For file uploads, don't send JSON content-type
-                headers = {k: v for k, v in self.headers.items() if k != "Content-Type"}
-                kwargs["headers"] = headers
-                kwargs["files"] = files
-                if json_data:
-                    kwargs["data"] = json_data
-            elif json_data:
-                kwargs["json"] = json_data
+    async def _send_request(
+        self,
+        method: str,
+        endpoint: Union[str, httpx.URL],
+        params: Optional[dict] = None,
+        json_data: Optional[dict] = None,
+        files: Optional[dict] = None,
+        revalidate: bool = False,
+    ) -> dict[str, Any]:
+        """Make HTTP request with retry logic and error handling.
 
-            response = await self.client.request(method, url, **kwargs)
+        Args:
+            method: HTTP method (GET, POST, PUT, DELETE)
+            endpoint: API endpoint path, or a pre-parsed absolute URL
+            params: Query parameters
+            json_data: JSON request body
+            files: Files to upload
+            revalidate: Keep the response for ETag revalidation (GET only)
+
+        Returns:
+            Response JSON data
+
+        Raises:
+            JiraAPIError: If request fails after retries
+        """
+        # Handle different endpoint formats:
+        # - Relative paths (/issues/...) - prepend REST API v2 base (the common case)
+        # - Full REST paths (/rest/...) - use as-is (for Agile API, etc.)
+        # - Full URLs (http/https or pre-parsed httpx.URL) - use as-is
+        if type(endpoint) is str and endpoint[0] == "/" and not endpoint.startswith("/rest/"):
+            url = self._api_prefix + endpoint
+        else:
+            url = endpoint
+
+        # Prepare request kwargs (shared by every attempt)
+        kwargs: dict[str, Any] = {"params": params}
+
+        if files:
+            # For file uploads, don't send JSON content-type
+            kwargs["headers"] = self._upload_headers
+            kwargs["files"] = files
+            if json_data:
+                kwargs["data"] = json_data
+        elif json_data:
+            # Content-Type: application/json comes from the client defaults
+            kwargs["content"] = json_dumps(json_data)
+
+        # Revalidate previously seen responses instead of re-downloading. Only
+        # opted-in endpoints (issues, transitions and metadata) are kept, so
+        # searches and listings don't churn the cache
+        etag_key = None
+        cached = None
+        if revalidate and method == "GET":
+            etag_key = (url, frozenset((params or {}).items()))
+            cached = self._etag_cache.get(etag_key)
+            if cached is not None:
+                kwargs["headers"] = {"If-None-Match": cached[0]}
+
+        max_retries = self.config.max_retries
+        delay = _BACKOFF_BASE
+        for attempt in range(max_retries + 1):
+            can_retry = attempt < max_retries
+            logger.debug("%s %s (attempt %s)", method, url, attempt + 1)
+
+            try:
+                response = await self.client.request(method, url, **kwargs)
+            except httpx.TimeoutException as e:
+                if not can_retry:
+                    raise JiraAPIError(f"Request timeout after {attempt + 1} attempts") from e
+                logger.warning("Request timeout, retrying... (%s)", attempt + 1)
+                delay = await self._backoff(delay)
+                continue
+            except httpx.NetworkError as e:
+                if not can_retry:
+                    raise JiraAPIError(f"Network error after {attempt + 1} attempts") from e
+                logger.warning("Network error, retrying... (%s)", attempt + 1)
+                delay = await self._backoff(delay)
+                continue
 
             # Handle different status codes
-            if response.status_code == 200:
-                return response.json() if response.content else {}
-            elif response.status_code == 201:
-                return response.json() if response.content else {}
-            elif response.status_code == 204:
+            status = response.status_code
+            if status in _SUCCESS_STATUSES:
+                data = json_loads(response.content) if response.content else {}
+                etag = response.headers.get("ETag")
+                if etag_key is not None and etag:
+                    self._etag_cache[etag_key] = (etag, response.content)
+                    self._etag_cache.move_to_end(etag_key)
+                    if len(self._etag_cache) > _ETAG_CACHE_SIZE:
+                        self._etag_cache.popitem(last=False)
+                if method == "GET":
+                    max_age = _MAX_AGE_RE.search(response.headers.get("Cache-Control", ""))
+                    if max_age:
+                        self._max_age[url] = float(max_age.group(1))
+                return data
+            elif status == 204:
                 return {}  # No content
-            elif response.status_code == 401:
-                raise JiraAuthenticationError(
-                    "Authentication failed. Check credentials.",
-                    status_code=401,
-                    response_data=self._safe_json(response),
-                )
-            elif response.status_code == 403:
-                raise JiraPermissionError(
-                    "Permission denied. Check user permissions.",
-                    status_code=403,
-                    response_data=self._safe_json(response),
-                )
-            elif response.status_code == 404:
-                raise JiraNotFoundError(
-                    f"Resource not found: {url}",
-                    status_code=404,
-                    response_data=self._safe_json(response),
-                )
-            elif response.status_code == 400:
+            elif status == 304 and cached is not None:
+                self._etag_cache.move_to_end(etag_key)
+                return json_loads(cached[1]) if cached[1] else {}
+
+            error = _ERROR_STATUSES.get(status)
+            if error is not None:
+                error_cls, template = error
                 error_data = self._safe_json(response)
-                error_msg = self._extract_error_message(error_data)
-                raise JiraValidationError(
-                    f"Validation error: {error_msg}",
-                    status_code=400,
+                detail = self._extract_error_message(error_data) if status == 400 else ""
+                raise error_cls(
+                    template.format(url=url, detail=detail),
+                    status_code=status,
                     response_data=error_data,
                 )
-            elif response.status_code == 429:
-                # Rate limit - retry with backoff
-                if retry_count < self.config.max_retries:
-                    await self._backoff(retry_count)
-                    return await self._request(
-                        method, endpoint, params, json_data, files, retry_count + 1
-                    )
-                raise JiraRateLimitError(
-                    "Rate limit exceeded",
-                    status_code=429,
-                    response_data=self._safe_json(response),
-                )
-            elif response.status_code >= 500:
-                # Server error - retry with backoff
-                if retry_count < self.config.max_retries:
-                    await self._backoff(retry_count)
-                    return await self._request(
-                        method, endpoint, params, json_data, files, retry_count + 1
+
+            if status == 429 or status >= 500:
+                # Rate limit / server error - retry after the advertised delay,
+                # unless the server asks us to wait too long
+                retry_after = self._parse_retry_after(response.headers.get("Retry-After"))
+                if can_retry and (retry_after is None or retry_after <= _MAX_RETRY_AFTER):
+                    delay = await self._backoff(delay, retry_after)
+                    continue
+                if status == 429:
+                    raise JiraRateLimitError(
+                        "Rate limit exceeded",
+                        status_code=429,
+                        response_data=self._safe_json(response),
                     )
                 raise JiraAPIError(
-                    f"Server error: {response.status_code}",
-                    status_code=response.status_code,
-                    response_data=self._safe_json(response),
-                )
-            else:
-                raise JiraAPIError(
-                    f"Unexpected status code: {response.status_code}",
-                    status_code=response.status_code,
+                    f"Server error: {status}",
+                    status_code=status,
                     response_data=self._safe_json(response),
                 )
 
-        except httpx.TimeoutException as e:
-            if retry_count < self.config.max_retries:
-                logger.warning(f"Request timeout, retrying... ({retry_count + 1})")
-                await self._backoff(retry_count)
-                return await self._request(
-                    method, endpoint, params, json_data, files, retry_count + 1
-                )
-            raise JiraAPIError(f"Request timeout after {retry_count + 1} attempts") from e
-
-        except httpx.NetworkError as e:
-            if retry_count < self.config.max_retries:
-                logger.warning(f"Network error, retrying... ({retry_count + 1})")
-                await self._backoff(retry_count)
-                return await self._request(
-                    method, endpoint, params, json_data, files, retry_count + 1
-                )
-            raise JiraAPIError(f"Network error after {retry_count + 1} attempts") from e
+            raise JiraAPIError(
+                f"Unexpected status code: {status}",
+                status_code=status,
+                response_data=self._safe_json(response),
+            )
+
+        # Unreachable: the final attempt always returns or raises
+        raise JiraAPIError(f"Request failed after {max_retries + 1} attempts")
 
     @staticmethod
     def _safe_json(response: httpx.Response) -> Optional[dict]:
         """Safely extract JSON from response."""
         try:
-            return response.json()
+            return json_loads(response.content)
         except Exception:
             return None
 
@@ -251,23 +552,87 @@ class JiraClient:
         if not error_data:
             return "Unknown error"
 
-        # Try different error message formats
-        if "errorMessages" in error_data and error_data["errorMessages"]:
-            return ", ".join(error_data["errorMessages"])
-        elif "errors" in error_data and error_data["errors"]:
-            errors = error_data["errors"]
+        # Try different error message formats, most common first
+        messages = error_data.get("errorMessages")
+        if messages:
+            return ", ".join(messages)
+        errors = error_data.get("errors")
+        if errors:
             return ", ".join(f"{k}: {v}" for k, v in errors.items())
-        elif "message" in error_data:
-            return error_data["message"]
-        else:
-            return str(error_data)
+        message = error_data.get("message")
+        if message is not None:
+            return message
+        return str(error_data)
 
     @staticmethod
-    async def _backoff(retry_count: int) -> None:
-        """Exponential backoff delay."""
-        delay = min(2**retry_count, 30)  # Max 30 seconds
-        logger.debug(f"Backing off for {delay} seconds")
+    def _parse_retry_after(retry_after: Optional[str]) -> Optional[float]:
+        """Parse a Retry-After header value (delta-seconds or HTTP-date).
+
+        Args:
+            retry_after: Raw header value
+
+        Returns:
+            Delay in seconds, or None if absent or unparseable
+        """
+        if not retry_after:
+            return None
+        try:
+            return float(int(retry_after))
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(retry_after)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return (retry_at - datetime.now(timezone.utc)).total_seconds()
+
+    async def _backoff(self, last_delay: float, retry_after: Optional[float] = None) -> float:
+        """Wait before retrying a request.
+
+        Honors the server's Retry-After header when present, otherwise uses
+        decorrelated-jitter backoff so concurrent retries don't wake in lockstep.
+
+        Args:
+            last_delay: Delay used before the previous retry of this request
+                (``_BACKOFF_BASE`` for the first retry)
+            retry_after: Parsed Retry-After delay from the response, if any
+
+        Returns:
+            The delay waited, to pass back in for the next retry
+        """
+        if retry_after is not None:
+            delay = max(retry_after, 1)
+        else:
+            delay = random.uniform(_BACKOFF_BASE, min(_BACKOFF_CAP, last_delay * 3))
+        logger.debug("Backing off for %s seconds", delay)
         await asyncio.sleep(delay)
+        return delay
+
+    @staticmethod
+    async def _gather_limited(
+        func: Callable[[K], Awaitable[T]],
+        keys: list[K],
+        concurrency: int,
+    ) -> list[Union[T, BaseException]]:
+        """Run ``func`` for each key concurrently, at most ``concurrency`` at a time.
+
+        Args:
+            func: Coroutine function called with each key
+            keys: Keys to process
+            concurrency: Maximum number of requests in flight
+
+        Returns:
+            Results in key order; failed calls yield their exception instead
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def one(key: K) -> T:
+            async with semaphore:
+                return await func(key)
+
+        return await asyncio.gather(*map(one, keys), return_exceptions=True)
 
     # ================== Issue Operations ==================
 
@@ -293,7 +658,20 @@ class JiraClient:
         if expand:
             params["expand"] = ",".join(expand)
 
-        return await self._request("GET", f"/issue/{key}", params=params)
+        return await self._request("GET", f"/issue/{key}", params=params, revalidate=True)
+
+    def user_field(self, user: str) -> dict[str, str]:
+        """Build the value of a user field (e.g. assignee) for this deployment.
+
+        Cloud identifies users by account ID; Server/Data Center by username.
+
+        Args:
+            user: Account ID (Cloud) or username (Server/Data Center)
+
+        Returns:
+            User reference for an issue fields payload
+        """
+        return {"accountId" if self.config.is_cloud else "name": user}
 
     async def create_issue(
         self,
@@ -323,7 +701,7 @@ class JiraClient:
         if "description" in kwargs:
             fields["description"] = kwargs["description"]
         if "assignee" in kwargs:
-            fields["assignee"] = {"name": kwargs["assignee"]}
+            fields["assignee"] = self.user_field(kwargs["assignee"])
         if "priority" in kwargs:
             fields["priority"] = {"name": kwargs["priority"]}
         if "labels" in kwargs:
@@ -344,16 +722,20 @@ class JiraClient:
         self,
         key: str,
         fields: dict[str, Any],
+        epic: Optional[str] = None,
     ) -> dict[str, Any]:
         """Update issue fields.
 
         Args:
             key: Issue key
             fields: Fields to update
+            epic: Epic key to link the issue to, sent in the same request
 
         Returns:
             Empty response on success
         """
+        if epic:
+            fields = {**fields, self.config.epic_link_field: epic}
         return await self._request("PUT", f"/issue/{key}", json_data={"fields": fields})
 
     async def delete_issue(self, key: str) -> dict[str, Any]:
@@ -373,6 +755,7 @@ class JiraClient:
         fields: Optional[list[str]] = None,
         max_results: int = 50,
         start_at: int = 0,
+        next_page_token: Optional[str] = None,
     ) -> dict[str, Any]:
         """Search issues with JQL.
 
@@ -381,6 +764,7 @@ class JiraClient:
             fields: Fields to include in results
             max_results: Maximum results to return
             start_at: Starting index for pagination
+            next_page_token: Continuation token from a previous Cloud page
 
         Returns:
             Search results with issues
@@ -390,22 +774,70 @@ class JiraClient:
             "maxResults": max_results,
             "startAt": start_at,
         }
+        if next_page_token:
+            params["nextPageToken"] = next_page_token
+
+        if fields:
+            params["fields"] = _join_fields(tuple(fields))
+        elif self.config.is_cloud:
+            params["fields"] = _DEFAULT_SEARCH_FIELDS_JOINED
+
+        return await self._request("GET", self._search_endpoint, params=params)
+
+    async def search_issues_paged(
+        self,
+        jql: str,
+        fields: Optional[list[str]] = None,
+        max_results: int = 50,
+        start_at: int = 0,
+        concurrency: int = 5,
+    ) -> dict[str, Any]:
+        """Search issues, collecting up to ``max_results`` across several pages.
+
+        Server/Data Center pages by ``startAt``, so once the first page reports
+        the total and the server's page size, the remaining pages are fetched
+        concurrently. Cloud's search/jql pages by token and is followed page
+        by page.
+
+        Args:
+            jql: JQL query string
+            fields: Fields to include in results
+            max_results: Maximum results to return
+            start_at: Starting index for pagination
+            concurrency: Maximum number of page requests in flight
+
+        Returns:
+            Search results shaped like a single ``search_issues`` page
+        """
+        first = await self.search_issues(jql, fields, max_results, start_at)
+        issues = list(first.get("issues", []))
 
-        # Cloud API v3 requires explicit fields (new search/jql endpoint doesn't return them by default)
         if self.config.is_cloud:
-            default_fields = [
-                "summary", "status", "priority", "issuetype", "assignee",
-                "reporter", "created", "updated", "description", "labels",
-                "components", "project", "resolution", "resolutiondate"
-            ]
-            params["fields"] = ",".join(fields if fields else default_fields)
-        elif fields:
-            params["fields"] = ",".join(fields)
+            page = first
+            while len(issues) < max_results and not page.get("isLast", True):
+                token = page.get("nextPageToken")
+                if not token:
+                    break
+                page = await self.search_issues(
+                    jql, fields, max_results - len(issues), start_at, token
+                )
+                issues.extend(page.get("issues", []))
+        else:
+            # The server caps maxResults; the first page shows at what size
+            stride = len(issues)
+            end = min(start_at + max_results, first.get("total", 0))
+            offsets = list(range(start_at + stride, end, stride)) if stride else []
+            pages = await self._gather_limited(
+                lambda offset: self.search_issues(jql, fields, min(stride, end - offset), offset),
+                offsets,
+                concurrency,
+            )
+            for page in pages:
+                if isinstance(page, BaseException):
+                    raise page
+                issues.extend(page.get("issues", []))
 
-        # Use new search/jql endpoint for Cloud (old endpoints deprecated - 410)
-        # See: https://developer.atlassian.com/changelog/#CHANGE-2046
-        endpoint = "/rest/api/3/search/jql" if self.config.is_cloud else "/search"
-        return await self._request("GET", endpoint, params=params)
+        return {**first, "issues": issues[:max_results], "maxResults": max_results}
 
     async def batch_create_issues(
         self,
@@ -430,7 +862,24 @@ class JiraClient:
         Returns:
             Changelog data
         """
-        return await self._request("GET", f"/issue/{key}?expand=changelog")
+        return await self._request("GET", f"/issue/{key}", params={"expand": "changelog"})
+
+    async def batch_get_changelogs(
+        self,
+        keys: list[str],
+        concurrency: int = 10,
+    ) -> list[Union[dict[str, Any], BaseException]]:
+        """Get changelogs for several issues concurrently.
+
+        Args:
+            keys: Issue keys
+            concurrency: Maximum number of requests in flight
+
+        Returns:
+            Issue data with expanded changelog per key, in order; failed
+            lookups yield the raised exception instead
+        """
+        return await self._gather_limited(self.get_issue_changelog, keys, concurrency)
 
     # ================== Comment Operations ==================
 
@@ -472,13 +921,14 @@ class JiraClient:
         Returns:
             Available transitions
         """
-        return await self._request("GET", f"/issue/{key}/transitions")
+        return await self._request("GET", f"/issue/{key}/transitions", revalidate=True)
 
     async def transition_issue(
         self,
         key: str,
         transition_id: str,
         fields: Optional[dict[str, Any]] = None,
+        comment: Optional[Any] = None,
     ) -> dict[str, Any]:
         """Transition issue to new status.
 
@@ -486,6 +936,8 @@ class JiraClient:
             key: Issue key
             transition_id: Transition ID
             fields: Optional fields to update during transition
+            comment: Optional comment body, added in the same request so it is
+                only posted if the transition succeeds
 
         Returns:
             Empty response on success
@@ -493,39 +945,50 @@ class JiraClient:
         data: dict[str, Any] = {"transition": {"id": transition_id}}
         if fields:
             data["fields"] = fields
+        if comment:
+            data["update"] = {"comment": [{"add": {"body": comment}}]}
 
         return await self._request("POST", f"/issue/{key}/transitions", json_data=data)
 
     # ================== Project Operations ==================
 
+    @_ttl_cached("/rest/api/2/project")
     async def get_all_projects(self) -> list[dict[str, Any]]:
         """Get all accessible projects.
 
         Returns:
             List of projects
         """
-        result = await self._request("GET", "/project")
+        result = await self._request("GET", "/project", revalidate=True)
         return result if isinstance(result, list) else []
 
     async def get_project_issues(
         self,
         project_key: str,
         jql_filter: Optional[str] = None,
+        max_results: int = 100,
     ) -> dict[str, Any]:
-        """Get all issues for a project.
+        """Get issues for a project.
 
         Args:
             project_key: Project key
             jql_filter: Optional additional JQL filter
+            max_results: Maximum results to return
 
         Returns:
             Search results
         """
+        return await self.search_issues(
+            self._project_jql(project_key, jql_filter), max_results=max_results
+        )
+
+    @staticmethod
+    def _project_jql(project_key: str, jql_filter: Optional[str]) -> str:
+        """Build the JQL selecting a project's issues."""
         jql = f"project = {project_key}"
         if jql_filter:
             jql += f" AND {jql_filter}"
-
-        return await self.search_issues(jql, max_results=100)
+        return jql
 
     # ================== Agile/Board Operations ==================
 
@@ -685,8 +1148,7 @@ class JiraClient:
         Returns:
             Empty response on success
         """
-        # Use epic link field
-        return await self.update_issue(issue_key, {"customfield_10014": epic_key})
+        return await self.update_issue(issue_key, {}, epic=epic_key)
 
     async def get_epic_issues(self, epic_key: str) -> dict[str, Any]:
         """Get all issues in an epic.
@@ -702,13 +1164,14 @@ class JiraClient:
 
     # ================== Issue Link Operations ==================
 
+    @_ttl_cached("/rest/api/2/issueLinkType")
     async def get_link_types(self) -> list[dict[str, Any]]:
         """Get all issue link types.
 
         Returns:
             List of link types
         """
-        result = await self._request("GET", "/issueLinkType")
+        result = await self._request("GET", "/issueLinkType", revalidate=True)
         return result.get("issueLinkTypes", []) if isinstance(result, dict) else []
 
     async def create_issue_link(
@@ -717,6 +1180,7 @@ class JiraClient:
         inward_key: str,
         outward_key: str,
         comment: Optional[str] = None,
+        link_type_id: Optional[str] = None,
     ) -> dict[str, Any]:
         """Create link between two issues.
 
@@ -725,12 +1189,13 @@ class JiraClient:
             inward_key: Inward issue key
             outward_key: Outward issue key
             comment: Optional comment for the link
+            link_type_id: Link type ID; sent instead of the name when known
 
         Returns:
             Empty response on success
         """
         data: dict[str, Any] = {
-            "type": {"name": link_type},
+            "type": {"id": link_type_id} if link_type_id else {"name": link_type},
             "inwardIssue": {"key": inward_key},
             "outwardIssue": {"key": outward_key},
         }
@@ -865,10 +1330,27 @@ class JiraClient:
         Returns:
             Attachment bytes
         """
-        endpoint = f"/attachment/content/{attachment_id}"
-        response = await self.client.get(endpoint)
-        response.raise_for_status()
-        return response.content
+        return b"".join([chunk async for chunk in self.iter_attachment(attachment_id)])
+
+    async def iter_attachment(
+        self,
+        attachment_id: str,
+        chunk_size: int = _DOWNLOAD_CHUNK_SIZE,
+    ) -> AsyncIterator[bytes]:
+        """Stream attachment content.
+
+        Args:
+            attachment_id: Attachment ID
+            chunk_size: Size of yielded chunks in bytes
+
+        Yields:
+            Attachment bytes, chunk by chunk
+        """
+        endpoint = f"/rest/api/2/attachment/content/{attachment_id}"
+        async with self.client.stream("GET", endpoint, follow_redirects=True) as response:
+            response.raise_for_status()
+            async for chunk in response.aiter_bytes(chunk_size):
+                yield chunk
 
     async def add_attachment(
         self,
@@ -891,36 +1373,46 @@ class JiraClient:
             raise FileNotFoundError(f"File not found: {file_path}")
 
         file_name = filename or path.name
+        boundary = secrets.token_hex(16)
+
+        # Stream the multipart body from disk in chunks rather than letting the
+        # file be read on the event loop; Content-Length is known up front
+        quoted_name = file_name.replace("\\", "\\\\").replace('"', "%22")
+        head = (
+            f"--{boundary}\r\n"
+            f'Content-Disposition: form-data; name="file"; filename="{quoted_name}"\r\n'
+            "Content-Type: application/octet-stream\r\n\r\n"
+        ).encode()
+        tail = f"\r\n--{boundary}--\r\n".encode()
+
+        async def body() -> AsyncIterator[bytes]:
+            yield head
+            async with await anyio.open_file(path, "rb") as f:
+                while chunk := await f.read(_UPLOAD_CHUNK_SIZE):
+                    yield chunk
+            yield tail
+
+        headers = {
+            **self._attachment_headers,
+            "Content-Type": f"multipart/form-data; boundary={boundary}",
+            "Content-Length": str(len(head) + path.stat().st_size + len(tail)),
+        }
+        endpoint = f"/rest/api/2/issue/{key}/attachments"
 
-        with open(path, "rb") as f:
-            files = {"file": (file_name, f, "application/octet-stream")}
-            # Attachment endpoint needs special headers
-            headers = {
-                "X-Atlassian-Token": "no-check",
-                "Accept": "application/json",
-            }
-            if "Authorization" in self.headers:
-                headers["Authorization"] = self.headers["Authorization"]
-
-            endpoint = f"/rest/api/2/issue/{key}/attachments"
+        response = await self.client.post(endpoint, content=body(), headers=headers)
 
-            response = await self.client.post(
-                endpoint,
-                files=files,
-                headers=headers,
+        if response.status_code == 200:
+            return json_loads(response.content)
+        else:
+            raise JiraAPIError(
+                f"Failed to upload attachment: {response.status_code}",
+                status_code=response.status_code,
+                response_data=self._safe_json(response),
             )
 
-            if response.status_code == 200:
-                return response.json()
-            else:
-                raise JiraAPIError(
-                    f"Failed to upload attachment: {response.status_code}",
-                    status_code=response.status_code,
-                    response_data=self._safe_json(response),
-                )
-
     # ================== User Operations ==================
 
+    @_ttl_cached("/rest/api/2/myself")
     async def get_current_user(self) -> dict[str, Any]:
         """Get current authenticated user.
 
@@ -930,6 +1422,7 @@ class JiraClient:
         endpoint = "/myself"
         return await self._request("GET", endpoint)
 
+    @_ttl_cached("/rest/api/2/user")
     async def get_user(self, account_id: str) -> dict[str, Any]:
         """Get user by account ID.
 
@@ -942,26 +1435,42 @@ class JiraClient:
         params = {"accountId": account_id}
         return await self._request("GET", "/user", params=params)
 
-    async def search_users(self, query: str) -> list[dict[str, Any]]:
+    async def get_user_profile(self, account_id: Optional[str] = None) -> dict[str, Any]:
+        """Get a user's profile, or the current user's if no account ID is given.
+
+        Args:
+            account_id: User account ID
+
+        Returns:
+            User data
+        """
+        if account_id:
+            return await self.get_user(account_id)
+        return await self.get_current_user()
+
+    @_ttl_cached("/rest/api/2/user/search")
+    async def search_users(self, query: str, max_results: int = 50) -> list[dict[str, Any]]:
         """Search for users.
 
         Args:
             query: Search query
+            max_results: Maximum number of users to return
 
         Returns:
             List of matching users
         """
-        params = {"query": query}
+        params = {"query": query, "maxResults": max_results}
         result = await self._request("GET", "/user/search", params=params)
         return result if isinstance(result, list) else []
 
     # ================== Field Operations ==================
 
+    @_ttl_cached("/rest/api/2/field")
     async def get_fields(self) -> list[dict[str, Any]]:
         """Get all available fields.
 
         Returns:
             List of field definitions
         """
-        result = await self._request("GET", "/field")
+        result = await self._request("GET", "/field", revalidate=True)
         return result if isinstance(result, list) else []
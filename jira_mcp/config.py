@@ -1,11 +1,16 @@
 """Configuration management for JIRA MCP Server using Pydantic Settings."""
 
-from functools import lru_cache
+import sys
+from dataclasses import dataclass
+from functools import cached_property
 from typing import Optional
 
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+_LOG_LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+_VALID_LOG_LEVELS = frozenset(_LOG_LEVELS)
+
 
 class JiraConfig(BaseSettings):
     """JIRA MCP Server configuration.
@@ -64,6 +69,35 @@ class JiraConfig(BaseSettings):
         ge=0,
         le=10,
     )
+    http2: bool = Field(
+        default=True,
+        description="Use HTTP/2 when the optional h2 package is installed",
+    )
+    max_connections: int = Field(
+        default=100,
+        description="Maximum number of concurrent HTTP connections",
+        ge=1,
+    )
+    max_keepalive_connections: int = Field(
+        default=50,
+        description="Maximum number of idle keep-alive HTTP connections",
+        ge=0,
+    )
+    keepalive_expiry: float = Field(
+        default=60.0,
+        description="Seconds an idle keep-alive connection is kept open",
+        ge=0,
+    )
+    epic_link_field: str = Field(
+        default="customfield_10014",
+        description="Custom field ID of the Epic Link field (varies per instance)",
+    )
+    metadata_cache_ttl: float = Field(
+        default=300.0,
+        description="Seconds to cache metadata (fields, projects, link types) "
+        "when the server sends no Cache-Control max-age",
+        ge=0,
+    )
     personal_access_token: Optional[str] = Field(
         default=None,
         description="Personal Access Token (alternative to username/api_token)",
@@ -82,38 +116,104 @@ class JiraConfig(BaseSettings):
     @classmethod
     def validate_log_level(cls, v: str) -> str:
         """Ensure log level is valid."""
-        valid_levels = {"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"}
         v_upper = v.upper()
-        if v_upper not in valid_levels:
-            raise ValueError(f"Log level must be one of: {', '.join(valid_levels)}")
+        if v_upper not in _VALID_LOG_LEVELS:
+            raise ValueError(f"Log level must be one of: {', '.join(_LOG_LEVELS)}")
         return v_upper
 
-    @property
+    @cached_property
     def enabled_tools_list(self) -> list[str]:
         """Get list of enabled tools."""
         if not self.enabled_tools:
             return []
-        return [t.strip() for t in self.enabled_tools.split(",") if t.strip()]
+        # Interned to match the (compiler-interned) tool name literals, so set
+        # lookups resolve on identity
+        return [sys.intern(t.strip()) for t in self.enabled_tools.split(",") if t.strip()]
 
-    @property
+    @cached_property
+    def enabled_tools_set(self) -> frozenset[str]:
+        """Get enabled tools as a frozenset for O(1) membership checks."""
+        return frozenset(self.enabled_tools_list)
+
+    @cached_property
     def is_cloud(self) -> bool:
         """Check if this is an Atlassian Cloud instance."""
         return "atlassian.net" in self.url
 
-    @property
+    @cached_property
     def use_pat(self) -> bool:
         """Check if Personal Access Token should be used."""
         return self.personal_access_token is not None
 
     def is_tool_enabled(self, tool_name: str) -> bool:
         """Check if a specific tool is enabled."""
-        enabled = self.enabled_tools_list
+        enabled = self.enabled_tools_set
         if not enabled:
             return True  # All tools enabled by default
         return tool_name in enabled
 
 
-@lru_cache
-def get_config() -> JiraConfig:
-    """Get cached configuration singleton."""
-    return JiraConfig()
+@dataclass(frozen=True, slots=True)
+class ConfigSnapshot:
+    """Immutable, slotted view of the non-secret settings the CLI reports.
+
+    Derived properties (``use_pat``, ``is_cloud``, enabled tools) are resolved
+    once when the snapshot is taken.
+    """
+
+    url: str
+    username: str
+    use_pat: bool
+    is_cloud: bool
+    read_only: bool
+    verify_ssl: bool
+    timeout: int
+    log_level: str
+    enabled_tools: frozenset[str]
+
+    @classmethod
+    def from_config(cls, config: JiraConfig) -> "ConfigSnapshot":
+        """Take a snapshot of a configuration.
+
+        Args:
+            config: JIRA configuration
+
+        Returns:
+            Snapshot of the configuration's non-secret settings
+        """
+        return cls(
+            url=config.url,
+            username=config.username,
+            use_pat=config.use_pat,
+            is_cloud=config.is_cloud,
+            read_only=config.read_only,
+            verify_ssl=config.verify_ssl,
+            timeout=config.timeout,
+            log_level=config.log_level,
+            enabled_tools=config.enabled_tools_set,
+        )
+
+
+# Configuration singleton, built on first use by get_config()
+_config: Optional[JiraConfig] = None
+
+
+def _load_config() -> JiraConfig:
+    """Build the configuration singleton from the environment."""
+    global _config
+    _config = JiraConfig()
+    return _config
+
+
+def get_config(refresh: bool = False) -> JiraConfig:
+    """Get cached configuration singleton.
+
+    Args:
+        refresh: Rebuild the configuration from the current environment
+
+    Returns:
+        JIRA configuration
+    """
+    if refresh:
+        return _load_config()
+    return _config or _load_config()
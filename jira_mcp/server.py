@@ -1,7 +1,8 @@
 """FastMCP server setup for JIRA MCP Server."""
 
 from contextlib import asynccontextmanager
-from typing import AsyncIterator, Optional
+from types import MappingProxyType
+from typing import Any, AsyncIterator, Mapping, Optional
 
 from fastmcp import FastMCP
 
@@ -13,40 +14,34 @@ from jira_mcp.utils.logging import get_logger
 
 
 @asynccontextmanager
-async def lifespan(mcp: FastMCP) -> AsyncIterator[dict]:
+async def lifespan(mcp: FastMCP) -> AsyncIterator[Mapping[str, Any]]:
     """Manage server lifecycle - initialize and cleanup JIRA client.
 
     Args:
         mcp: FastMCP server instance
 
     Yields:
-        Context dictionary with JIRA client
+        Read-only context mapping with the JIRA client
     """
     logger = get_logger()
     logger.info("Initializing JIRA MCP Server...")
 
-    # Get config from server context
-    config: JiraConfig = mcp.context.get("config")
-    read_only_override: Optional[bool] = mcp.context.get("read_only_override")
+    # Config, client and the resolved read-only flag from create_server.
+    # The client's HTTP connection pool is opened lazily on the first request
+    # inside this event loop
+    context: Mapping[str, Any] = mcp.context
+    config: JiraConfig = context["config"]
+    client: JiraClient = context["client"]
 
-    # Create JIRA client
-    client = JiraClient(config)
-
-    # Store in context for tools to access
-    context = {
-        "client": client,
-        "config": config,
-        "read_only": read_only_override if read_only_override is not None else config.read_only,
-    }
-
-    logger.info(f"Connected to JIRA: {config.url}")
-    logger.info(f"Read-only mode: {context['read_only']}")
+    logger.info("Connected to JIRA: %s", config.url)
+    logger.info("Read-only mode: %s", context["read_only"])
 
     try:
         yield context
     finally:
         logger.info("Shutting down JIRA MCP Server...")
         await client.close()
+        await JiraClient.close_all()
         logger.info("JIRA client closed")
 
 
@@ -73,24 +68,27 @@ def create_server(
         lifespan=lifespan,
     )
 
-    # Store config in server context for lifespan to access
-    mcp.context = {
-        "config": config,
-        "read_only_override": read_only_override,
-    }
+    # Fold the CLI override into the config once, so the tools, the lifespan
+    # and the context all see the same read-only flag
+    if read_only_override is not None and read_only_override != config.read_only:
+        config = config.model_copy(update={"read_only": read_only_override})
 
-    # Determine effective read-only setting
-    effective_read_only = (
-        read_only_override if read_only_override is not None else config.read_only
-    )
+    # One client shared by the tools and the lifespan. Constructing it does no
+    # I/O, so it is safe to create before the server's event loop starts
+    client = JiraClient(config)
 
-    # Create a temporary client for tool registration (will be replaced in lifespan)
-    # This is needed because tools are registered before the server starts
-    temp_client = JiraClient(config)
+    # Store config and client in server context for lifespan to access
+    mcp.context = MappingProxyType(
+        {
+            "config": config,
+            "client": client,
+            "read_only": config.read_only,
+        }
+    )
 
     # Register all tools
     logger.info("Registering JIRA tools...")
-    register_all_tools(mcp, temp_client, config)
+    register_all_tools(mcp, client, config)
     logger.info("All JIRA tools registered")
 
     return mcp
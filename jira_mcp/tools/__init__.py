@@ -15,21 +15,32 @@ from jira_mcp.tools.users import register_user_tools
 from jira_mcp.tools.fields import register_field_tools
 
 
+# Per-category registration functions, in the order their tools are listed
+_REGISTRARS = (
+    register_issue_tools,
+    register_comment_tools,
+    register_transition_tools,
+    register_project_tools,
+    register_board_tools,
+    register_sprint_tools,
+    register_epic_tools,
+    register_link_tools,
+    register_worklog_tools,
+    register_version_tools,
+    register_attachment_tools,
+    register_user_tools,
+    register_field_tools,
+)
+
+
 def register_all_tools(mcp, client, config):
-    """Register all JIRA tools with the MCP server."""
-    register_issue_tools(mcp, client, config)
-    register_comment_tools(mcp, client, config)
-    register_transition_tools(mcp, client, config)
-    register_project_tools(mcp, client, config)
-    register_board_tools(mcp, client, config)
-    register_sprint_tools(mcp, client, config)
-    register_epic_tools(mcp, client, config)
-    register_link_tools(mcp, client, config)
-    register_worklog_tools(mcp, client, config)
-    register_version_tools(mcp, client, config)
-    register_attachment_tools(mcp, client, config)
-    register_user_tools(mcp, client, config)
-    register_field_tools(mcp, client, config)
+    """Register all JIRA tools with the MCP server.
+
+    Every tool closes over the one ``client`` passed here and makes its HTTP
+    calls through it, so they all share its pooled keep-alive connections.
+    """
+    for register in _REGISTRARS:
+        register(mcp, client, config)
 
 
 __all__ = ["register_all_tools"]
@@ -0,0 +1,60 @@
+"""Helpers shared by the tool registration functions."""
+
+from functools import wraps
+from typing import Any, Awaitable, Callable, Optional, TypeVar
+
+from fastmcp import FastMCP
+
+from jira_mcp.utils.logging import get_logger
+
+F = TypeVar("F", bound=Callable)
+
+
+def _unregistered(fn: F) -> F:
+    """Leave a disabled tool's function as-is, without registering it."""
+    return fn
+
+
+def tool_if(mcp: FastMCP, enabled: bool) -> Callable[[F], F]:
+    """Register the decorated function as an MCP tool only when enabled.
+
+    Enablement (tool filtering, read-only mode for write tools) is fixed at
+    startup, so disabled tools are left out of the server entirely instead of
+    checking on every call.
+
+    Args:
+        mcp: FastMCP server instance
+        enabled: Whether to register the tool
+
+    Returns:
+        ``mcp.tool()`` when enabled, otherwise a no-op decorator
+    """
+    return mcp.tool() if enabled else _unregistered
+
+
+def tool_error_handler(
+    action: Optional[str] = None,
+) -> Callable[[Callable[..., Awaitable[str]]], Callable[..., Awaitable[str]]]:
+    """Turn exceptions raised by a tool into an error message for the client.
+
+    Args:
+        action: What the tool was doing, used as "Error {action}: ..."; a bare
+            "Error: ..." prefix is used when omitted
+
+    Returns:
+        Decorator for async tool functions
+    """
+    prefix = f"Error {action}" if action else "Error"
+
+    def decorator(fn: Callable[..., Awaitable[str]]) -> Callable[..., Awaitable[str]]:
+        @wraps(fn)
+        async def wrapper(*args: Any, **kwargs: Any) -> str:
+            try:
+                return await fn(*args, **kwargs)
+            except Exception as e:
+                get_logger().error("%s failed: %s", fn.__name__, e)
+                return f"{prefix}: {e}"
+
+        return wrapper
+
+    return decorator
@@ -1,11 +1,30 @@
 """JIRA Attachment Tools - Manage issue attachments."""
 
+from itertools import chain
 from typing import Any
 
 from fastmcp import FastMCP
 
 from jira_mcp.client import JiraClient
 from jira_mcp.config import JiraConfig
+from jira_mcp.tools._registry import tool_error_handler, tool_if
+
+_SIZE_UNITS = ("KB", "MB", "GB", "TB")
+
+
+def _format_size(size: int) -> str:
+    """Format a byte count as a human-readable size.
+
+    The unit is picked from the bit length (one step per 2**10), starting at KB.
+
+    Args:
+        size: Size in bytes
+
+    Returns:
+        Size with two decimals and its unit (e.g. "1.50 MB")
+    """
+    index = min(max((size.bit_length() - 1) // 10 - 1, 0), len(_SIZE_UNITS) - 1)
+    return f"{size / (1 << (10 * (index + 1))):.2f} {_SIZE_UNITS[index]}"
 
 
 def format_attachments(data: dict[str, Any]) -> str:
@@ -22,7 +41,7 @@ def format_attachments(data: dict[str, Any]) -> str:
     if not attachments:
         return "No attachments found for this issue."
 
-    lines = ["# Attachments\n"]
+    body: list[str] = []
     total_size = 0
 
     for attachment in attachments:
@@ -33,26 +52,21 @@ def format_attachments(data: dict[str, Any]) -> str:
         mime_type = attachment.get("mimeType", "unknown")
         content_url = attachment.get("content", "")
 
-        # Convert size to human-readable format
-        size_kb = size / 1024
-        size_str = f"{size_kb:.2f} KB" if size_kb < 1024 else f"{size_kb / 1024:.2f} MB"
-
         total_size += size
 
-        lines.append(f"## {filename}")
-        lines.append(f"- **Size:** {size_str}")
-        lines.append(f"- **Type:** {mime_type}")
-        lines.append(f"- **Author:** {author}")
-        lines.append(f"- **Created:** {created}")
-        lines.append(f"- **URL:** {content_url}\n")
+        body.append(f"## {filename}")
+        body.append(f"- **Size:** {_format_size(size)}")
+        body.append(f"- **Type:** {mime_type}")
+        body.append(f"- **Author:** {author}")
+        body.append(f"- **Created:** {created}")
+        body.append(f"- **URL:** {content_url}\n")
 
-    # Total size
-    total_kb = total_size / 1024
-    total_str = f"{total_kb:.2f} KB" if total_kb < 1024 else f"{total_kb / 1024:.2f} MB"
-    lines.insert(1, f"**Total Size:** {total_str}\n")
-    lines.insert(1, f"**Total Attachments:** {len(attachments)}")
-
-    return "\n".join(lines)
+    header = (
+        "# Attachments\n",
+        f"**Total Attachments:** {len(attachments)}",
+        f"**Total Size:** {_format_size(total_size)}\n",
+    )
+    return "\n".join(chain(header, body))
 
 
 def format_attachment_uploaded(data: dict[str, Any]) -> str:
@@ -76,13 +90,9 @@ def format_attachment_uploaded(data: dict[str, Any]) -> str:
         size = attachment.get("size", 0)
         attachment_id = attachment.get("id", "N/A")
 
-        # Convert size to human-readable format
-        size_kb = size / 1024
-        size_str = f"{size_kb:.2f} KB" if size_kb < 1024 else f"{size_kb / 1024:.2f} MB"
-
         lines.append(f"- **File:** {filename}")
         lines.append(f"- **ID:** {attachment_id}")
-        lines.append(f"- **Size:** {size_str}")
+        lines.append(f"- **Size:** {_format_size(size)}")
 
     return "\n".join(lines)
 
@@ -96,7 +106,8 @@ def register_attachment_tools(mcp: FastMCP, client: JiraClient, config: JiraConf
         config: JIRA configuration
     """
 
-    @mcp.tool()
+    @tool_if(mcp, config.is_tool_enabled("jira_download_attachments"))
+    @tool_error_handler("retrieving attachments")
     async def jira_download_attachments(issue_key: str) -> str:
         """Get attachment metadata for a JIRA issue.
 
@@ -113,15 +124,13 @@ def register_attachment_tools(mcp: FastMCP, client: JiraClient, config: JiraConf
         Example:
             jira_download_attachments("PROJ-123")
         """
-        if not config.is_tool_enabled("jira_download_attachments"):
-            return "Tool is disabled by configuration"
-
         issue = await client.get_issue(issue_key, fields=["attachment"])
         attachments = issue.get("fields", {}).get("attachment", [])
         result = {"attachments": attachments}
         return format_attachments(result)
 
-    @mcp.tool()
+    @tool_if(mcp, config.is_tool_enabled("jira_add_attachment") and not config.read_only)
+    @tool_error_handler("uploading attachment")
     async def jira_add_attachment(
         issue_key: str,
         file_path: str,
@@ -144,12 +153,6 @@ def register_attachment_tools(mcp: FastMCP, client: JiraClient, config: JiraConf
             jira_add_attachment("PROJ-123", "/path/to/screenshot.png")
             jira_add_attachment("PROJ-456", "/path/to/doc.pdf", "requirements.pdf")
         """
-        if not config.is_tool_enabled("jira_add_attachment"):
-            return "Tool is disabled by configuration"
-
-        if config.read_only:
-            return "Operation not allowed: Server is in read-only mode"
-
         result = await client.add_attachment(
             key=issue_key,
             file_path=file_path,
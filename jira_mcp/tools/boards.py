@@ -1,11 +1,15 @@
 """Board operations for JIRA Agile."""
 
+from itertools import chain
 from typing import Any, Optional
 
 from fastmcp import FastMCP
 
 from jira_mcp.client import JiraClient
 from jira_mcp.config import JiraConfig
+from jira_mcp.tools._registry import tool_error_handler, tool_if
+from jira_mcp.utils.fields import nested_get
+from jira_mcp.utils.markdown import TABLE_CELL_ESCAPE
 
 
 def format_boards(boards: list[dict[str, Any]]) -> str:
@@ -36,6 +40,21 @@ def format_boards(boards: list[dict[str, Any]]) -> str:
     return "\n".join(output)
 
 
+def _board_issue_row(issue: dict[str, Any]) -> str:
+    """Format one issue as a board table row."""
+    fields = issue.get('fields') or {}
+    summary = fields.get('summary', 'N/A')
+    issue_type = nested_get(fields, 'issuetype', 'name', 'N/A')
+    status = nested_get(fields, 'status', 'name', 'N/A')
+    assignee = nested_get(fields, 'assignee', 'displayName', 'Unassigned')
+
+    # Escape pipes and flatten newlines so the row stays intact
+    summary = summary.translate(TABLE_CELL_ESCAPE)
+    assignee = assignee.translate(TABLE_CELL_ESCAPE)
+
+    return f"| {issue.get('key', 'N/A')} | {summary} | {issue_type} | {status} | {assignee} |"
+
+
 def format_board_issues(issues: list[dict[str, Any]], board_name: str = "Board") -> str:
     """Format board issues as readable markdown.
 
@@ -49,28 +68,13 @@ def format_board_issues(issues: list[dict[str, Any]], board_name: str = "Board")
     if not issues:
         return f"No issues found on {board_name}."
 
-    output = [f"# Issues on {board_name}\n"]
-    output.append(f"Total: {len(issues)} issue(s)\n")
-    output.append("| Key | Summary | Type | Status | Assignee |")
-    output.append("|-----|---------|------|--------|----------|")
-
-    for issue in issues:
-        key = issue.get('key', 'N/A')
-        fields = issue.get('fields', {})
-        summary = fields.get('summary', 'N/A')
-        issue_type = fields.get('issuetype', {}).get('name', 'N/A')
-        status = fields.get('status', {}).get('name', 'N/A')
-
-        assignee_data = fields.get('assignee')
-        assignee = assignee_data.get('displayName', 'Unassigned') if assignee_data else 'Unassigned'
-
-        # Escape pipe characters in values
-        summary = summary.replace('|', '\\|')
-        assignee = assignee.replace('|', '\\|')
-
-        output.append(f"| {key} | {summary} | {issue_type} | {status} | {assignee} |")
-
-    return "\n".join(output)
+    header = (
+        f"# Issues on {board_name}\n",
+        f"Total: {len(issues)} issue(s)\n",
+        "| Key | Summary | Type | Status | Assignee |",
+        "|-----|---------|------|--------|----------|",
+    )
+    return "\n".join(chain(header, map(_board_issue_row, issues)))
 
 
 def register_board_tools(mcp: FastMCP, client: JiraClient, config: JiraConfig) -> None:
@@ -82,7 +86,8 @@ def register_board_tools(mcp: FastMCP, client: JiraClient, config: JiraConfig) -
         config: JIRA configuration
     """
 
-    @mcp.tool()
+    @tool_if(mcp, config.is_tool_enabled("jira_get_agile_boards"))
+    @tool_error_handler("retrieving boards")
     async def jira_get_agile_boards(
         project_key: Optional[str] = None,
         board_type: Optional[str] = None,
@@ -101,20 +106,15 @@ def register_board_tools(mcp: FastMCP, client: JiraClient, config: JiraConfig) -
             - Get boards for project: jira_get_agile_boards(project_key="PROJ")
             - Get scrum boards: jira_get_agile_boards(board_type="scrum")
         """
-        if not config.is_tool_enabled("jira_get_agile_boards"):
-            return "Tool 'jira_get_agile_boards' is disabled by configuration."
-
-        try:
-            result = await client.get_agile_boards(
-                project_key=project_key,
-                board_type=board_type,
-            )
-            boards = result.get("values", []) if isinstance(result, dict) else result
-            return format_boards(boards)
-        except Exception as e:
-            return f"Error retrieving boards: {str(e)}"
-
-    @mcp.tool()
+        result = await client.get_agile_boards(
+            project_key=project_key,
+            board_type=board_type,
+        )
+        boards = result.get("values", []) if isinstance(result, dict) else result
+        return format_boards(boards)
+
+    @tool_if(mcp, config.is_tool_enabled("jira_get_board_issues"))
+    @tool_error_handler("retrieving board issues")
     async def jira_get_board_issues(
         board_id: int,
         jql: Optional[str] = None,
@@ -135,25 +135,19 @@ def register_board_tools(mcp: FastMCP, client: JiraClient, config: JiraConfig) -
             - Filter by assignee: jira_get_board_issues(board_id=123, jql="assignee = currentUser()")
             - Limit results: jira_get_board_issues(board_id=123, max_results=20)
         """
-        if not config.is_tool_enabled("jira_get_board_issues"):
-            return "Tool 'jira_get_board_issues' is disabled by configuration."
-
         # Validate max_results
         if max_results > 100:
             max_results = 100
         elif max_results < 1:
             max_results = 1
 
-        try:
-            result = await client.get_board_issues(
-                board_id=board_id,
-                jql=jql,
-                max_results=max_results,
-            )
+        result = await client.get_board_issues(
+            board_id=board_id,
+            jql=jql,
+            max_results=max_results,
+        )
 
-            issues = result.get('issues', [])
-            board_name = result.get('board_name', f"Board {board_id}")
+        issues = result.get('issues', [])
+        board_name = result.get('board_name', f"Board {board_id}")
 
-            return format_board_issues(issues, board_name)
-        except Exception as e:
-            return f"Error retrieving board issues: {str(e)}"
+        return format_board_issues(issues, board_name)
@@ -6,6 +6,8 @@ from fastmcp import FastMCP
 
 from jira_mcp.client import JiraClient
 from jira_mcp.config import JiraConfig
+from jira_mcp.tools._registry import tool_error_handler, tool_if
+from jira_mcp.utils.adf import adf_to_text, text_to_adf
 from jira_mcp.utils.logging import get_logger
 
 
@@ -21,10 +23,10 @@ def format_comments(comments_data: dict[str, Any]) -> str:
     comments = comments_data.get("comments", [])
     total = comments_data.get("total", 0)
 
-    output = f"# Comments ({total} total)\n\n"
-
     if not comments:
-        return output + "No comments found.\n"
+        return f"# Comments ({total} total)\n\nNo comments found.\n"
+
+    parts = [f"# Comments ({total} total)", ""]
 
     for comment in comments:
         author = comment.get("author", {}).get("displayName", "Unknown")
@@ -35,9 +37,9 @@ def format_comments(comments_data: dict[str, Any]) -> str:
         if isinstance(body, dict):
             body = _extract_text_from_adf(body)
 
-        output += f"## {author} - {created}\n\n{body}\n\n---\n\n"
+        parts.extend((f"## {author} - {created}", "", body, "", "---", ""))
 
-    return output
+    return "\n".join(parts) + "\n"
 
 
 def _extract_text_from_adf(adf: dict[str, Any]) -> str:
@@ -49,22 +51,7 @@ def _extract_text_from_adf(adf: dict[str, Any]) -> str:
     Returns:
         Extracted text
     """
-    if not isinstance(adf, dict):
-        return str(adf)
-
-    text_parts = []
-    content = adf.get("content", [])
-
-    for node in content:
-        if node.get("type") == "paragraph":
-            para_content = node.get("content", [])
-            para_text = []
-            for text_node in para_content:
-                if text_node.get("type") == "text":
-                    para_text.append(text_node.get("text", ""))
-            text_parts.append("".join(para_text))
-
-    return "\n\n".join(text_parts) if text_parts else ""
+    return adf_to_text(adf)
 
 
 def register_comment_tools(mcp: FastMCP, client: JiraClient, config: JiraConfig) -> None:
@@ -77,7 +64,8 @@ def register_comment_tools(mcp: FastMCP, client: JiraClient, config: JiraConfig)
     """
     logger = get_logger()
 
-    @mcp.tool()
+    @tool_if(mcp, config.is_tool_enabled("jira_add_comment") and not config.read_only)
+    @tool_error_handler()
     async def jira_add_comment(issue_key: str, comment: str) -> str:
         """Add a comment to a JIRA issue.
 
@@ -93,34 +81,18 @@ def register_comment_tools(mcp: FastMCP, client: JiraClient, config: JiraConfig)
         Example:
             jira_add_comment("PROJ-123", "This has been fixed in the latest release")
         """
-        if not config.is_tool_enabled("jira_add_comment"):
-            return "Tool is disabled by configuration"
-
-        if config.read_only:
-            return "Error: Cannot add comment - server is in read-only mode"
-
-        try:
-            logger.info(f"Adding comment to issue: {issue_key}")
+        logger.info("Adding comment to issue: %s", issue_key)
 
-            # Convert plain text to ADF format
-            adf_body = {
-                "type": "doc",
-                "version": 1,
-                "content": [
-                    {
-                        "type": "paragraph",
-                        "content": [{"type": "text", "text": comment}],
-                    }
-                ],
-            }
+        # Convert plain text to ADF format
+        adf_body = text_to_adf(comment)
 
-            result = await client.add_comment(issue_key, adf_body)
+        result = await client.add_comment(issue_key, adf_body)
 
-            author = result.get("author", {}).get("displayName", "Unknown")
-            created = result.get("created", "N/A")
-            comment_id = result.get("id", "N/A")
+        author = result.get("author", {}).get("displayName", "Unknown")
+        created = result.get("created", "N/A")
+        comment_id = result.get("id", "N/A")
 
-            return f"""✅ Comment added successfully!
+        return f"""✅ Comment added successfully!
 
 **Comment ID:** {comment_id}
 **Author:** {author}
@@ -129,11 +101,9 @@ def register_comment_tools(mcp: FastMCP, client: JiraClient, config: JiraConfig)
 **Comment:**
 {comment}
 """
-        except Exception as e:
-            logger.error(f"Failed to add comment to {issue_key}: {e}")
-            return f"Error: {str(e)}"
 
-    @mcp.tool()
+    @tool_if(mcp, config.is_tool_enabled("jira_get_comments"))
+    @tool_error_handler()
     async def jira_get_comments(issue_key: str) -> str:
         """Get all comments for a JIRA issue.
 
@@ -148,13 +118,6 @@ def register_comment_tools(mcp: FastMCP, client: JiraClient, config: JiraConfig)
         Example:
             jira_get_comments("PROJ-123")
         """
-        if not config.is_tool_enabled("jira_get_comments"):
-            return "Tool is disabled by configuration"
-
-        try:
-            logger.info(f"Getting comments for issue: {issue_key}")
-            result = await client.get_comments(issue_key)
-            return format_comments(result)
-        except Exception as e:
-            logger.error(f"Failed to get comments for {issue_key}: {e}")
-            return f"Error: {str(e)}"
+        logger.info("Getting comments for issue: %s", issue_key)
+        result = await client.get_comments(issue_key)
+        return format_comments(result)
@@ -1,11 +1,38 @@
 """Epic operations for JIRA Agile."""
 
+from itertools import chain
 from typing import Any
 
 from fastmcp import FastMCP
 
 from jira_mcp.client import JiraClient
 from jira_mcp.config import JiraConfig
+from jira_mcp.tools._registry import tool_error_handler, tool_if
+from jira_mcp.utils.fields import nested_get
+from jira_mcp.utils.markdown import TABLE_CELL_ESCAPE
+
+
+def _epic_issue_row(issue: dict[str, Any]) -> str:
+    """Format one issue as an epic table row."""
+    fields = issue.get('fields') or {}
+    summary = fields.get('summary', 'N/A')
+    issue_type = nested_get(fields, 'issuetype', 'name', 'N/A')
+    status = nested_get(fields, 'status', 'name', 'N/A')
+    assignee = nested_get(fields, 'assignee', 'displayName', 'Unassigned')
+
+    # Story points can be in different custom fields
+    story_points = fields.get('customfield_10016') or fields.get('storyPoints', 'N/A')
+    if story_points and not isinstance(story_points, str):
+        story_points = str(story_points)
+
+    # Escape pipes and flatten newlines so the row stays intact
+    summary = summary.translate(TABLE_CELL_ESCAPE)
+    assignee = assignee.translate(TABLE_CELL_ESCAPE)
+
+    return (
+        f"| {issue.get('key', 'N/A')} | {summary} | {issue_type} | {status} "
+        f"| {assignee} | {story_points} |"
+    )
 
 
 def format_epic_issues(issues: list[dict[str, Any]], epic_key: str) -> str:
@@ -21,33 +48,13 @@ def format_epic_issues(issues: list[dict[str, Any]], epic_key: str) -> str:
     if not issues:
         return f"No issues found for epic {epic_key}."
 
-    output = [f"# Issues in Epic {epic_key}\n"]
-    output.append(f"Total: {len(issues)} issue(s)\n")
-    output.append("| Key | Summary | Type | Status | Assignee | Story Points |")
-    output.append("|-----|---------|------|--------|----------|--------------|")
-
-    for issue in issues:
-        key = issue.get('key', 'N/A')
-        fields = issue.get('fields', {})
-        summary = fields.get('summary', 'N/A')
-        issue_type = fields.get('issuetype', {}).get('name', 'N/A')
-        status = fields.get('status', {}).get('name', 'N/A')
-
-        assignee_data = fields.get('assignee')
-        assignee = assignee_data.get('displayName', 'Unassigned') if assignee_data else 'Unassigned'
-
-        # Story points can be in different custom fields
-        story_points = fields.get('customfield_10016') or fields.get('storyPoints', 'N/A')
-        if story_points and not isinstance(story_points, str):
-            story_points = str(story_points)
-
-        # Escape pipe characters
-        summary = summary.replace('|', '\\|')
-        assignee = assignee.replace('|', '\\|')
-
-        output.append(f"| {key} | {summary} | {issue_type} | {status} | {assignee} | {story_points} |")
-
-    return "\n".join(output)
+    header = (
+        f"# Issues in Epic {epic_key}\n",
+        f"Total: {len(issues)} issue(s)\n",
+        "| Key | Summary | Type | Status | Assignee | Story Points |",
+        "|-----|---------|------|--------|----------|--------------|",
+    )
+    return "\n".join(chain(header, map(_epic_issue_row, issues)))
 
 
 def register_epic_tools(mcp: FastMCP, client: JiraClient, config: JiraConfig) -> None:
@@ -59,7 +66,8 @@ def register_epic_tools(mcp: FastMCP, client: JiraClient, config: JiraConfig) ->
         config: JIRA configuration
     """
 
-    @mcp.tool()
+    @tool_if(mcp, config.is_tool_enabled("jira_link_to_epic") and not config.read_only)
+    @tool_error_handler("linking issue to epic")
     async def jira_link_to_epic(
         issue_key: str,
         epic_key: str,
@@ -80,22 +88,14 @@ def register_epic_tools(mcp: FastMCP, client: JiraClient, config: JiraConfig) ->
             - Link story to epic: jira_link_to_epic(issue_key="PROJ-123", epic_key="PROJ-100")
             - Link task to epic: jira_link_to_epic(issue_key="PROJ-456", epic_key="PROJ-100")
         """
-        if not config.is_tool_enabled("jira_link_to_epic"):
-            return "Tool 'jira_link_to_epic' is disabled by configuration."
-
-        if config.read_only:
-            return "Cannot link issue to epic: Server is in read-only mode."
-
-        try:
-            await client.link_issue_to_epic(
-                issue_key=issue_key,
-                epic_key=epic_key,
-            )
-            return f"Successfully linked {issue_key} to epic {epic_key}."
-        except Exception as e:
-            return f"Error linking issue to epic: {str(e)}"
-
-    @mcp.tool()
+        await client.link_issue_to_epic(
+            issue_key=issue_key,
+            epic_key=epic_key,
+        )
+        return f"Successfully linked {issue_key} to epic {epic_key}."
+
+    @tool_if(mcp, config.is_tool_enabled("jira_get_epic_issues"))
+    @tool_error_handler("retrieving epic issues")
     async def jira_get_epic_issues(
         epic_key: str,
         max_results: int = 50,
@@ -113,20 +113,14 @@ def register_epic_tools(mcp: FastMCP, client: JiraClient, config: JiraConfig) ->
             - Get all epic issues: jira_get_epic_issues(epic_key="PROJ-100")
             - Limit results: jira_get_epic_issues(epic_key="PROJ-100", max_results=20)
         """
-        if not config.is_tool_enabled("jira_get_epic_issues"):
-            return "Tool 'jira_get_epic_issues' is disabled by configuration."
-
         # Validate max_results
         if max_results > 100:
             max_results = 100
         elif max_results < 1:
             max_results = 1
 
-        try:
-            issues = await client.get_epic_issues(
-                epic_key=epic_key,
-                max_results=max_results,
-            )
-            return format_epic_issues(issues, epic_key)
-        except Exception as e:
-            return f"Error retrieving epic issues: {str(e)}"
+        issues = await client.get_epic_issues(
+            epic_key=epic_key,
+            max_results=max_results,
+        )
+        return format_epic_issues(issues, epic_key)
@@ -6,6 +6,7 @@ from fastmcp import FastMCP
 
 from jira_mcp.client import JiraClient
 from jira_mcp.config import JiraConfig
+from jira_mcp.tools._registry import tool_error_handler, tool_if
 from jira_mcp.utils.logging import get_logger
 
 
@@ -18,10 +19,12 @@ def format_fields(fields: list[dict[str, Any]]) -> str:
     Returns:
         Formatted markdown string
     """
-    output = f"# JIRA Fields ({len(fields)} total)\n\n"
+    header = f"# JIRA Fields ({len(fields)} total)\n\n"
 
     if not fields:
-        return output + "No fields found.\n"
+        return header + "No fields found.\n"
+
+    parts = [header]
 
     for field in fields:
         field_id = field.get("id", "N/A")
@@ -30,12 +33,14 @@ def format_fields(fields: list[dict[str, Any]]) -> str:
         custom = field.get("custom", False)
         field_type_label = "Custom" if custom else "System"
 
-        output += f"## {name}\n\n"
-        output += f"- **ID:** `{field_id}`\n"
-        output += f"- **Type:** {field_type}\n"
-        output += f"- **Category:** {field_type_label}\n\n"
+        parts.append(
+            f"## {name}\n\n"
+            f"- **ID:** `{field_id}`\n"
+            f"- **Type:** {field_type}\n"
+            f"- **Category:** {field_type_label}\n\n"
+        )
 
-    return output
+    return "".join(parts)
 
 
 def register_field_tools(mcp: FastMCP, client: JiraClient, config: JiraConfig) -> None:
@@ -48,8 +53,24 @@ def register_field_tools(mcp: FastMCP, client: JiraClient, config: JiraConfig) -
     """
     logger = get_logger()
 
-    @mcp.tool()
-    async def jira_search_fields(query: Optional[str] = None) -> str:
+    # Casefolded (field, name, id) rows for the last full field list fetched.
+    # While the list is cached the client hands out copies holding the same
+    # field dicts, which list equality matches by identity, so the rows are
+    # only rebuilt once the fields change.
+    indexed: Optional[list[dict[str, Any]]] = None
+    rows: list[tuple[dict[str, Any], str, str]] = []
+
+    def _search_rows(fields: list[dict[str, Any]]) -> list[tuple[dict[str, Any], str, str]]:
+        """Return the casefolded search rows for ``fields``, rebuilding them if needed."""
+        nonlocal indexed, rows
+        if indexed != fields:
+            indexed = fields
+            rows = [(f, f.get("name", "").casefold(), f.get("id", "").casefold()) for f in fields]
+        return rows
+
+    @tool_if(mcp, config.is_tool_enabled("jira_search_fields"))
+    @tool_error_handler()
+    async def jira_search_fields(query: Optional[str] = None, refresh: bool = False) -> str:
         """Search JIRA field definitions.
 
         Retrieves metadata about JIRA fields including custom fields, system fields,
@@ -58,6 +79,7 @@ def register_field_tools(mcp: FastMCP, client: JiraClient, config: JiraConfig) -
 
         Args:
             query: Optional search query to filter fields by name (default: None, returns all)
+            refresh: Bypass the cached field list and fetch it from JIRA again (default: False)
 
         Returns:
             Field definitions in markdown
@@ -67,30 +89,20 @@ def register_field_tools(mcp: FastMCP, client: JiraClient, config: JiraConfig) -
             jira_search_fields("assignee")
             jira_search_fields("custom")
         """
-        if not config.is_tool_enabled("jira_search_fields"):
-            return "Tool is disabled by configuration"
-
-        try:
-            logger.info(f"Searching fields{f' with query: {query}' if query else ''}")
-            result = await client.get_fields()
-
-            # API returns array directly
-            if isinstance(result, list):
-                fields = result
-            else:
-                fields = result.get("values", [])
-
-            # Filter by query if provided (client-side filtering as backup)
-            if query:
-                query_lower = query.lower()
-                fields = [
-                    f for f in fields
-                    if query_lower in f.get("name", "").lower()
-                    or query_lower in f.get("id", "").lower()
-                ]
-
-            return format_fields(fields)
-
-        except Exception as e:
-            logger.error(f"Failed to search fields: {e}")
-            return f"Error: {str(e)}"
+        if query:
+            logger.info("Searching fields with query: %s", query)
+        else:
+            logger.info("Searching fields")
+
+        # The field list is cached for metadata_cache_ttl seconds by the client
+        if refresh:
+            client.invalidate_metadata(url="/rest/api/2/field")
+
+        fields = await client.get_fields()
+
+        # Filter by name or ID against the cached full list
+        if query:
+            needle = query.casefold()
+            fields = [f for f, name, fid in _search_rows(fields) if needle in name or needle in fid]
+
+        return format_fields(fields)
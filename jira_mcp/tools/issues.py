@@ -1,12 +1,37 @@
 """JIRA Issue Tools - CRUD and search operations."""
 
+import re
+from collections import OrderedDict
 from typing import Any, Optional
 
 from fastmcp import FastMCP
 
 from jira_mcp.client import JiraClient
 from jira_mcp.config import JiraConfig
+from jira_mcp.tools._registry import tool_error_handler, tool_if
+from jira_mcp.utils.adf import adf_to_text, text_to_adf
 from jira_mcp.utils.logging import get_logger
+from jira_mcp.utils.serialization import json_loads
+
+# One item of a comma-separated argument, without surrounding whitespace
+_CSV_RE = re.compile(r"[^,\s](?:[^,]*[^,\s])?")
+
+# Plain-text descriptions keyed on (issue key, updated timestamp); JIRA bumps
+# "updated" on every edit, so a stale entry is never hit again
+_DESCRIPTION_CACHE_SIZE = 1024
+_description_cache: OrderedDict[tuple[str, str], str] = OrderedDict()
+
+
+def _split_csv(value: Optional[str]) -> Optional[list[str]]:
+    """Split a comma-separated tool argument into its non-empty, stripped items.
+
+    Args:
+        value: Comma-separated string, or None
+
+    Returns:
+        List of items, or None if no value was given
+    """
+    return _CSV_RE.findall(value) if value else None
 
 
 def format_issue(issue: dict[str, Any]) -> str:
@@ -28,7 +53,7 @@ def format_issue(issue: dict[str, Any]) -> str:
 
     # Handle Atlassian Document Format (ADF) for description
     if isinstance(description, dict):
-        description = _extract_text_from_adf(description)
+        description = _description_text(key, fields.get("updated"), description)
 
     output = f"""# {key}: {summary}
 
@@ -42,31 +67,43 @@ def format_issue(issue: dict[str, Any]) -> str:
     return output
 
 
-def _extract_text_from_adf(adf: dict[str, Any]) -> str:
-    """Extract plain text from Atlassian Document Format.
+def _description_text(key: str, updated: Optional[str], adf: dict[str, Any]) -> str:
+    """Extract an issue description's text, reusing earlier results.
+
+    Issues without a key or an ``updated`` timestamp are converted uncached.
 
     Args:
-        adf: ADF document structure
+        key: Issue key
+        updated: The issue's ``updated`` field, if it was requested
+        adf: ADF description
 
     Returns:
         Extracted text
     """
-    if not isinstance(adf, dict):
-        return str(adf)
+    if key == "N/A" or not updated:
+        return _extract_text_from_adf(adf)
+
+    cache_key = (key, updated)
+    text = _description_cache.get(cache_key)
+    if text is None:
+        text = _description_cache[cache_key] = _extract_text_from_adf(adf)
+        if len(_description_cache) > _DESCRIPTION_CACHE_SIZE:
+            _description_cache.popitem(last=False)
+    else:
+        _description_cache.move_to_end(cache_key)
+    return text
+
 
-    text_parts = []
-    content = adf.get("content", [])
+def _extract_text_from_adf(adf: dict[str, Any]) -> str:
+    """Extract plain text from Atlassian Document Format.
 
-    for node in content:
-        if node.get("type") == "paragraph":
-            para_content = node.get("content", [])
-            para_text = []
-            for text_node in para_content:
-                if text_node.get("type") == "text":
-                    para_text.append(text_node.get("text", ""))
-            text_parts.append("".join(para_text))
+    Args:
+        adf: ADF document structure
 
-    return "\n\n".join(text_parts) if text_parts else "No description"
+    Returns:
+        Extracted text
+    """
+    return adf_to_text(adf) or "No description"
 
 
 def format_search_results(results: dict[str, Any]) -> str:
@@ -82,7 +119,7 @@ def format_search_results(results: dict[str, Any]) -> str:
     total = results.get("total", 0)
     start_at = results.get("startAt", 0)
 
-    output = f"# Search Results\n\n**Total:** {total} issues (showing from {start_at})\n\n"
+    parts = [f"# Search Results\n\n**Total:** {total} issues (showing from {start_at})\n\n"]
 
     for issue in issues:
         fields = issue.get("fields", {})
@@ -90,9 +127,9 @@ def format_search_results(results: dict[str, Any]) -> str:
         summary = fields.get("summary", "N/A")
         status = (fields.get("status") or {}).get("name", "N/A")
 
-        output += f"- **{key}**: {summary} [{status}]\n"
+        parts.append(f"- **{key}**: {summary} [{status}]\n")
 
-    return output
+    return "".join(parts)
 
 
 def register_issue_tools(mcp: FastMCP, client: JiraClient, config: JiraConfig) -> None:
@@ -105,7 +142,8 @@ def register_issue_tools(mcp: FastMCP, client: JiraClient, config: JiraConfig) -
     """
     logger = get_logger()
 
-    @mcp.tool()
+    @tool_if(mcp, config.is_tool_enabled("jira_get_issue"))
+    @tool_error_handler()
     async def jira_get_issue(
         issue_key: str,
         fields: Optional[str] = None,
@@ -128,20 +166,14 @@ def register_issue_tools(mcp: FastMCP, client: JiraClient, config: JiraConfig) -
             jira_get_issue("PROJ-123")
             jira_get_issue("PROJ-123", fields="summary,status,assignee")
         """
-        if not config.is_tool_enabled("jira_get_issue"):
-            return "Tool is disabled by configuration"
-
-        try:
-            logger.info(f"Getting issue: {issue_key}")
-            fields_list = [f.strip() for f in fields.split(",") if f.strip()] if fields else None
-            expand_list = [e.strip() for e in expand.split(",") if e.strip()] if expand else None
-            result = await client.get_issue(issue_key, fields_list, expand_list)
-            return format_issue(result)
-        except Exception as e:
-            logger.error(f"Failed to get issue {issue_key}: {e}")
-            return f"Error: {str(e)}"
-
-    @mcp.tool()
+        logger.info("Getting issue: %s", issue_key)
+        fields_list = _split_csv(fields)
+        expand_list = _split_csv(expand)
+        result = await client.get_issue(issue_key, fields_list, expand_list)
+        return format_issue(result)
+
+    @tool_if(mcp, config.is_tool_enabled("jira_create_issue") and not config.read_only)
+    @tool_error_handler()
     async def jira_create_issue(
         project_key: str,
         summary: str,
@@ -150,6 +182,7 @@ def register_issue_tools(mcp: FastMCP, client: JiraClient, config: JiraConfig) -
         assignee: Optional[str] = None,
         priority: Optional[str] = None,
         labels: Optional[str] = None,
+        fetch_full: bool = False,
     ) -> str:
         """Create a new JIRA issue.
 
@@ -160,74 +193,53 @@ def register_issue_tools(mcp: FastMCP, client: JiraClient, config: JiraConfig) -
             summary: Issue summary/title
             issue_type: Issue type (e.g., Bug, Task, Story)
             description: Issue description (optional)
-            assignee: Assignee account ID or email (optional)
+            assignee: Assignee account ID (Cloud) or username (Server/Data Center) (optional)
             priority: Priority name (e.g., High, Medium, Low) (optional)
             labels: Comma-separated labels (optional)
+            fetch_full: Fetch the created issue and show all its details, at the cost of
+                a second request (default: False)
 
         Returns:
-            Created issue details in markdown
+            Confirmation with the new issue key, summary, type and project;
+            full issue details in markdown when fetch_full is set
 
         Example:
             jira_create_issue("PROJ", "Fix login bug", "Bug", "Users cannot login")
             jira_create_issue("PROJ", "Add feature", "Story", labels="feature,p1")
         """
-        if not config.is_tool_enabled("jira_create_issue"):
-            return "Tool is disabled by configuration"
-
-        if config.read_only:
-            return "Error: Cannot create issue - server is in read-only mode"
-
-        try:
-            logger.info(f"Creating issue in project: {project_key}")
-
-            # Build issue data
-            issue_data = {
-                "fields": {
-                    "project": {"key": project_key},
-                    "summary": summary,
-                    "issuetype": {"name": issue_type},
-                }
-            }
+        logger.info("Creating issue in project: %s", project_key)
+
+        # Optional fields, passed through to the client in one call
+        extra: dict[str, Any] = {}
+        if description:
+            extra["description"] = text_to_adf(description)
+        if assignee:
+            extra["assignee"] = assignee
+        if priority:
+            extra["priority"] = priority
+        if labels:
+            extra["labels"] = _split_csv(labels)
+
+        result = await client.create_issue(project_key, issue_type, summary, **extra)
+
+        created_key = result.get("key")
+        if not created_key:
+            return f"✅ Issue created: {result}"
 
-            # Add optional fields
-            if description:
-                issue_data["fields"]["description"] = {
-                    "type": "doc",
-                    "version": 1,
-                    "content": [
-                        {
-                            "type": "paragraph",
-                            "content": [{"type": "text", "text": description}],
-                        }
-                    ],
-                }
-
-            if assignee:
-                issue_data["fields"]["assignee"] = {"id": assignee}
-
-            if priority:
-                issue_data["fields"]["priority"] = {"name": priority}
-
-            if labels:
-                issue_data["fields"]["labels"] = [
-                    label.strip() for label in labels.split(",")
-                ]
-
-            result = await client.create_issue(issue_data)
-
-            # Fetch the created issue to get full details
-            created_key = result.get("key")
-            if created_key:
-                full_issue = await client.get_issue(created_key)
-                return f"✅ Issue created successfully!\n\n{format_issue(full_issue)}"
-            else:
-                return f"✅ Issue created: {result}"
-
-        except Exception as e:
-            logger.error(f"Failed to create issue: {e}")
-            return f"Error: {str(e)}"
-
-    @mcp.tool()
+        if fetch_full:
+            full_issue = await client.get_issue(created_key)
+            return f"✅ Issue created successfully!\n\n{format_issue(full_issue)}"
+
+        return f"""✅ Issue created successfully!
+
+**Key:** {created_key}
+**Summary:** {summary}
+**Type:** {issue_type}
+**Project:** {project_key}
+"""
+
+    @tool_if(mcp, config.is_tool_enabled("jira_update_issue") and not config.read_only)
+    @tool_error_handler()
     async def jira_update_issue(
         issue_key: str,
         summary: Optional[str] = None,
@@ -235,6 +247,7 @@ def register_issue_tools(mcp: FastMCP, client: JiraClient, config: JiraConfig) -
         assignee: Optional[str] = None,
         priority: Optional[str] = None,
         labels: Optional[str] = None,
+        fetch_full: bool = False,
     ) -> str:
         """Update an existing JIRA issue.
 
@@ -244,66 +257,49 @@ def register_issue_tools(mcp: FastMCP, client: JiraClient, config: JiraConfig) -
             issue_key: The issue key (e.g., PROJ-123)
             summary: New summary/title (optional)
             description: New description (optional)
-            assignee: New assignee account ID or email (optional)
+            assignee: New assignee account ID (Cloud) or username (Server/Data Center) (optional)
             priority: New priority name (optional)
             labels: New comma-separated labels (optional)
+            fetch_full: Fetch the updated issue and show all its details, at the cost of
+                a second request (default: False)
 
         Returns:
-            Updated issue details in markdown
+            Confirmation with the issue key and the names of the updated fields;
+            full issue details in markdown when fetch_full is set
 
         Example:
             jira_update_issue("PROJ-123", summary="Updated title")
             jira_update_issue("PROJ-123", priority="High", labels="urgent,bug")
         """
-        if not config.is_tool_enabled("jira_update_issue"):
-            return "Tool is disabled by configuration"
-
-        if config.read_only:
-            return "Error: Cannot update issue - server is in read-only mode"
-
-        try:
-            logger.info(f"Updating issue: {issue_key}")
-
-            # Build update data
-            update_data = {"fields": {}}
-
-            if summary:
-                update_data["fields"]["summary"] = summary
-
-            if description:
-                update_data["fields"]["description"] = {
-                    "type": "doc",
-                    "version": 1,
-                    "content": [
-                        {
-                            "type": "paragraph",
-                            "content": [{"type": "text", "text": description}],
-                        }
-                    ],
-                }
-
-            if assignee:
-                update_data["fields"]["assignee"] = {"id": assignee}
-
-            if priority:
-                update_data["fields"]["priority"] = {"name": priority}
-
-            if labels:
-                update_data["fields"]["labels"] = [
-                    label.strip() for label in labels.split(",")
-                ]
-
-            await client.update_issue(issue_key, update_data)
-
-            # Fetch updated issue
+        logger.info("Updating issue: %s", issue_key)
+
+        fields: dict[str, Any] = {}
+        if summary:
+            fields["summary"] = summary
+        if description:
+            fields["description"] = text_to_adf(description)
+        if assignee:
+            fields["assignee"] = client.user_field(assignee)
+        if priority:
+            fields["priority"] = {"name": priority}
+        if labels:
+            fields["labels"] = _split_csv(labels)
+
+        await client.update_issue(issue_key, fields)
+
+        if fetch_full:
             updated_issue = await client.get_issue(issue_key)
             return f"✅ Issue updated successfully!\n\n{format_issue(updated_issue)}"
 
-        except Exception as e:
-            logger.error(f"Failed to update issue {issue_key}: {e}")
-            return f"Error: {str(e)}"
+        updated = ", ".join(fields) or "none"
+        return f"""✅ Issue updated successfully!
 
-    @mcp.tool()
+**Issue:** {issue_key}
+**Updated fields:** {updated}
+"""
+
+    @tool_if(mcp, config.is_tool_enabled("jira_delete_issue") and not config.read_only)
+    @tool_error_handler()
     async def jira_delete_issue(issue_key: str) -> str:
         """Delete a JIRA issue.
 
@@ -318,21 +314,12 @@ def register_issue_tools(mcp: FastMCP, client: JiraClient, config: JiraConfig) -
         Example:
             jira_delete_issue("PROJ-123")
         """
-        if not config.is_tool_enabled("jira_delete_issue"):
-            return "Tool is disabled by configuration"
-
-        if config.read_only:
-            return "Error: Cannot delete issue - server is in read-only mode"
+        logger.info("Deleting issue: %s", issue_key)
+        await client.delete_issue(issue_key)
+        return f"✅ Issue {issue_key} deleted successfully"
 
-        try:
-            logger.info(f"Deleting issue: {issue_key}")
-            await client.delete_issue(issue_key)
-            return f"✅ Issue {issue_key} deleted successfully"
-        except Exception as e:
-            logger.error(f"Failed to delete issue {issue_key}: {e}")
-            return f"Error: {str(e)}"
-
-    @mcp.tool()
+    @tool_if(mcp, config.is_tool_enabled("jira_search"))
+    @tool_error_handler()
     async def jira_search(
         jql: str,
         max_results: int = 50,
@@ -357,19 +344,13 @@ def register_issue_tools(mcp: FastMCP, client: JiraClient, config: JiraConfig) -
             jira_search("assignee = currentUser() AND status != Done", max_results=10)
             jira_search("labels = urgent", fields="summary,status,assignee")
         """
-        if not config.is_tool_enabled("jira_search"):
-            return "Tool is disabled by configuration"
-
-        try:
-            logger.info(f"Searching issues with JQL: {jql}")
-            fields_list = [f.strip() for f in fields.split(",") if f.strip()] if fields else None
-            result = await client.search_issues(jql, fields_list, max_results, start_at)
-            return format_search_results(result)
-        except Exception as e:
-            logger.error(f"Failed to search issues: {e}")
-            return f"Error: {str(e)}"
-
-    @mcp.tool()
+        logger.info("Searching issues with JQL: %s", jql)
+        fields_list = _split_csv(fields)
+        result = await client.search_issues_paged(jql, fields_list, max_results, start_at)
+        return format_search_results(result)
+
+    @tool_if(mcp, config.is_tool_enabled("jira_batch_create_issues") and not config.read_only)
+    @tool_error_handler()
     async def jira_batch_create_issues(issues_json: str) -> str:
         """Bulk create multiple JIRA issues.
 
@@ -390,83 +371,56 @@ def register_issue_tools(mcp: FastMCP, client: JiraClient, config: JiraConfig) -
                 {"projectKey": "PROJ", "summary": "Bug 2", "issueType": "Bug"}
             ]')
         """
-        if not config.is_tool_enabled("jira_batch_create_issues"):
-            return "Tool is disabled by configuration"
-
-        if config.read_only:
-            return "Error: Cannot create issues - server is in read-only mode"
-
-        try:
-            import json
-
-            logger.info("Batch creating issues")
-
-            # Parse input JSON
-            issues_data = json.loads(issues_json)
-
-            # Build bulk request
-            issues = []
-            for issue_obj in issues_data:
-                issue_data = {
-                    "fields": {
-                        "project": {"key": issue_obj["projectKey"]},
-                        "summary": issue_obj["summary"],
-                        "issuetype": {"name": issue_obj["issueType"]},
-                    }
-                }
-
-                # Add optional fields
-                if "description" in issue_obj:
-                    issue_data["fields"]["description"] = {
-                        "type": "doc",
-                        "version": 1,
-                        "content": [
-                            {
-                                "type": "paragraph",
-                                "content": [
-                                    {"type": "text", "text": issue_obj["description"]}
-                                ],
-                            }
-                        ],
-                    }
-
-                if "assignee" in issue_obj:
-                    issue_data["fields"]["assignee"] = {"id": issue_obj["assignee"]}
-
-                if "priority" in issue_obj:
-                    issue_data["fields"]["priority"] = {"name": issue_obj["priority"]}
-
-                if "labels" in issue_obj:
-                    issue_data["fields"]["labels"] = issue_obj["labels"]
-
-                issues.append(issue_data)
-
-            result = await client.batch_create_issues(issues)
-
-            # Format results
-            created = result.get("issues", [])
-            errors = result.get("errors", [])
-
-            output = f"# Batch Create Results\n\n**Created:** {len(created)} issues\n**Errors:** {len(errors)}\n\n"
-
-            if created:
-                output += "## Successfully Created\n\n"
-                for issue in created:
-                    key = issue.get("key", "N/A")
-                    output += f"- {key}\n"
-
-            if errors:
-                output += "\n## Errors\n\n"
-                for error in errors:
-                    output += f"- {error}\n"
-
-            return output
-
-        except Exception as e:
-            logger.error(f"Failed to batch create issues: {e}")
-            return f"Error: {str(e)}"
-
-    @mcp.tool()
+        logger.info("Batch creating issues")
+
+        # Parse input JSON
+        issues_data = json_loads(issues_json)
+
+        # Build bulk request
+        issues = []
+        for issue_obj in issues_data:
+            fields = {
+                "project": {"key": issue_obj["projectKey"]},
+                "summary": issue_obj["summary"],
+                "issuetype": {"name": issue_obj["issueType"]},
+            }
+            if "description" in issue_obj:
+                fields["description"] = text_to_adf(issue_obj["description"])
+            if "assignee" in issue_obj:
+                fields["assignee"] = client.user_field(issue_obj["assignee"])
+            if "priority" in issue_obj:
+                fields["priority"] = {"name": issue_obj["priority"]}
+            if "labels" in issue_obj:
+                fields["labels"] = issue_obj["labels"]
+
+            issues.append({"fields": fields})
+
+        result = await client.batch_create_issues(issues)
+
+        # Format results
+        created = result.get("issues", [])
+        errors = result.get("errors", [])
+
+        parts = [
+            f"# Batch Create Results\n\n**Created:** {len(created)} issues\n"
+            f"**Errors:** {len(errors)}\n\n"
+        ]
+
+        if created:
+            parts.append("## Successfully Created\n\n")
+            for issue in created:
+                key = issue.get("key", "N/A")
+                parts.append(f"- {key}\n")
+
+        if errors:
+            parts.append("\n## Errors\n\n")
+            for error in errors:
+                parts.append(f"- {error}\n")
+
+        return "".join(parts)
+
+    @tool_if(mcp, config.is_tool_enabled("jira_batch_get_changelogs"))
+    @tool_error_handler()
     async def jira_batch_get_changelogs(issue_keys: str) -> str:
         """Get changelogs for multiple issues.
 
@@ -481,48 +435,39 @@ def register_issue_tools(mcp: FastMCP, client: JiraClient, config: JiraConfig) -
         Example:
             jira_batch_get_changelogs("PROJ-123,PROJ-456")
         """
-        if not config.is_tool_enabled("jira_batch_get_changelogs"):
-            return "Tool is disabled by configuration"
-
-        try:
-            keys_list = [key.strip() for key in issue_keys.split(",")]
-            logger.info(f"Getting changelogs for {len(keys_list)} issues")
-
-            changelogs = []
-            for key in keys_list:
-                try:
-                    changelog_data = await client.get_issue_changelog(key)
-                    changelogs.append({"issueKey": key, "changelog": changelog_data.get("changelog", {})})
-                except Exception as e:
-                    logger.warning(f"Failed to get changelog for {key}: {e}")
-
-            output = "# Issue Changelogs\n\n"
-
-            for issue_data in changelogs:
-                key = issue_data.get("issueKey", "N/A")
-                histories = issue_data.get("changelog", {}).get("histories", [])
-
-                output += f"## {key}\n\n"
-
-                if not histories:
-                    output += "No changes recorded.\n\n"
-                    continue
-
-                for history in histories:
-                    author = history.get("author", {}).get("displayName", "Unknown")
-                    created = history.get("created", "N/A")
-                    output += f"**{author}** - {created}\n\n"
-
-                    for item in history.get("items", []):
-                        field = item.get("field", "N/A")
-                        from_val = item.get("fromString", "")
-                        to_val = item.get("toString", "")
-                        output += f"  - {field}: {from_val} → {to_val}\n"
-
-                    output += "\n"
-
-            return output
-
-        except Exception as e:
-            logger.error(f"Failed to get changelogs: {e}")
-            return f"Error: {str(e)}"
+        keys_list = _split_csv(issue_keys) or []
+        logger.info("Getting changelogs for %s issues", len(keys_list))
+
+        changelogs = []
+        results = await client.batch_get_changelogs(keys_list)
+        for key, changelog_data in zip(keys_list, results):
+            if isinstance(changelog_data, BaseException):
+                logger.warning("Failed to get changelog for %s: %s", key, changelog_data)
+                continue
+            changelogs.append({"issueKey": key, "changelog": changelog_data.get("changelog", {})})
+
+        parts = ["# Issue Changelogs\n\n"]
+
+        for issue_data in changelogs:
+            key = issue_data.get("issueKey", "N/A")
+            histories = issue_data.get("changelog", {}).get("histories", [])
+
+            parts.append(f"## {key}\n\n")
+
+            if not histories:
+                parts.append("No changes recorded.\n\n")
+                continue
+
+            for history in histories:
+                author = history.get("author", {}).get("displayName", "Unknown")
+                created = history.get("created", "N/A")
+                parts.append(f"**{author}** - {created}\n\n")
+
+                parts.extend(
+                    f"  - {item.get('field', 'N/A')}: {item.get('fromString', '')}"
+                    f" → {item.get('toString', '')}\n"
+                    for item in history.get("items", [])
+                )
+                parts.append("\n")
+
+        return "".join(parts)
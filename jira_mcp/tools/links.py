@@ -6,6 +6,7 @@ from fastmcp import FastMCP
 
 from jira_mcp.client import JiraClient
 from jira_mcp.config import JiraConfig
+from jira_mcp.tools._registry import tool_error_handler, tool_if
 
 
 def format_link_types(link_types: list[dict[str, Any]]) -> str:
@@ -78,7 +79,8 @@ def register_link_tools(mcp: FastMCP, client: JiraClient, config: JiraConfig) ->
         config: JIRA configuration
     """
 
-    @mcp.tool()
+    @tool_if(mcp, config.is_tool_enabled("jira_get_link_types"))
+    @tool_error_handler("retrieving link types")
     async def jira_get_link_types() -> str:
         """Get all available issue link types.
 
@@ -88,16 +90,11 @@ def register_link_tools(mcp: FastMCP, client: JiraClient, config: JiraConfig) ->
         Returns:
             Formatted markdown string with link types
         """
-        if not config.is_tool_enabled("jira_get_link_types"):
-            return "Tool is disabled by configuration"
+        result = await client.get_link_types()
+        return format_link_types(result)
 
-        try:
-            result = await client.get_link_types()
-            return format_link_types(result)
-        except Exception as e:
-            return f"Error retrieving link types: {str(e)}"
-
-    @mcp.tool()
+    @tool_if(mcp, config.is_tool_enabled("jira_create_issue_link") and not config.read_only)
+    @tool_error_handler("creating issue link")
     async def jira_create_issue_link(
         link_type: str,
         inward_issue: str,
@@ -121,21 +118,29 @@ def register_link_tools(mcp: FastMCP, client: JiraClient, config: JiraConfig) ->
         Example:
             jira_create_issue_link("Blocks", "PROJ-123", "PROJ-456", "Blocking issue")
         """
-        if not config.is_tool_enabled("jira_create_issue_link"):
-            return "Tool is disabled by configuration"
-
-        if config.read_only:
-            return "Operation not allowed: Server is in read-only mode"
+        # Resolve the name against the (TTL-cached) link types so typos fail
+        # without a round-trip
+        link_types = await client.get_link_types()
+        wanted = link_type.casefold()
+        link_type_id = next(
+            (lt.get("id") for lt in link_types if lt.get("name", "").casefold() == wanted),
+            None,
+        )
+        if link_types and link_type_id is None:
+            available = ", ".join(lt.get("name", "N/A") for lt in link_types)
+            return f"Error: Link type '{link_type}' not found. Available link types: {available}"
 
         result = await client.create_issue_link(
             link_type=link_type,
             inward_key=inward_issue,
             outward_key=outward_issue,
             comment=comment if comment else None,
+            link_type_id=link_type_id,
         )
         return format_issue_link(result)
 
-    @mcp.tool()
+    @tool_if(mcp, config.is_tool_enabled("jira_remove_issue_link") and not config.read_only)
+    @tool_error_handler("removing issue link")
     async def jira_remove_issue_link(link_id: str) -> str:
         """Remove an issue link by ID.
 
@@ -151,16 +156,11 @@ def register_link_tools(mcp: FastMCP, client: JiraClient, config: JiraConfig) ->
         Example:
             jira_remove_issue_link("10001")
         """
-        if not config.is_tool_enabled("jira_remove_issue_link"):
-            return "Tool is disabled by configuration"
-
-        if config.read_only:
-            return "Operation not allowed: Server is in read-only mode"
-
         await client.remove_issue_link(link_id)
         return f"Issue link {link_id} removed successfully."
 
-    @mcp.tool()
+    @tool_if(mcp, config.is_tool_enabled("jira_create_remote_issue_link") and not config.read_only)
+    @tool_error_handler("creating remote link")
     async def jira_create_remote_issue_link(
         issue_key: str,
         url: str,
@@ -189,12 +189,6 @@ def register_link_tools(mcp: FastMCP, client: JiraClient, config: JiraConfig) ->
                 "Pull request fixing this issue"
             )
         """
-        if not config.is_tool_enabled("jira_create_remote_issue_link"):
-            return "Tool is disabled by configuration"
-
-        if config.read_only:
-            return "Operation not allowed: Server is in read-only mode"
-
         result = await client.create_remote_link(
             key=issue_key,
             url=url,
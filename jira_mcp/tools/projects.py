@@ -1,11 +1,13 @@
 """JIRA Project Tools - Project operations."""
 
+from itertools import islice
 from typing import Any
 
 from fastmcp import FastMCP
 
 from jira_mcp.client import JiraClient
 from jira_mcp.config import JiraConfig
+from jira_mcp.tools._registry import tool_error_handler, tool_if
 from jira_mcp.utils.logging import get_logger
 
 
@@ -18,10 +20,12 @@ def format_projects(projects: list[dict[str, Any]]) -> str:
     Returns:
         Formatted markdown string
     """
-    output = f"# Projects ({len(projects)} total)\n\n"
+    header = f"# Projects ({len(projects)} total)\n\n"
 
     if not projects:
-        return output + "No projects found.\n"
+        return header + "No projects found.\n"
+
+    parts = [header]
 
     for project in projects:
         key = project.get("key", "N/A")
@@ -29,11 +33,9 @@ def format_projects(projects: list[dict[str, Any]]) -> str:
         project_type = project.get("projectTypeKey", "N/A")
         lead = project.get("lead", {}).get("displayName", "N/A")
 
-        output += f"## {key}: {name}\n\n"
-        output += f"- **Type:** {project_type}\n"
-        output += f"- **Lead:** {lead}\n\n"
+        parts.append(f"## {key}: {name}\n\n- **Type:** {project_type}\n- **Lead:** {lead}\n\n")
 
-    return output
+    return "".join(parts)
 
 
 def register_project_tools(mcp: FastMCP, client: JiraClient, config: JiraConfig) -> None:
@@ -46,7 +48,8 @@ def register_project_tools(mcp: FastMCP, client: JiraClient, config: JiraConfig)
     """
     logger = get_logger()
 
-    @mcp.tool()
+    @tool_if(mcp, config.is_tool_enabled("jira_get_all_projects"))
+    @tool_error_handler()
     async def jira_get_all_projects() -> str:
         """Get all JIRA projects.
 
@@ -58,24 +61,17 @@ def register_project_tools(mcp: FastMCP, client: JiraClient, config: JiraConfig)
         Example:
             jira_get_all_projects()
         """
-        if not config.is_tool_enabled("jira_get_all_projects"):
-            return "Tool is disabled by configuration"
-
-        try:
-            logger.info("Getting all projects")
-            result = await client.get_all_projects()
+        logger.info("Getting all projects")
+        result = await client.get_all_projects()
 
-            # API returns array directly
-            if isinstance(result, list):
-                return format_projects(result)
-            else:
-                return format_projects(result.get("values", []))
+        # API returns array directly
+        if isinstance(result, list):
+            return format_projects(result)
+        else:
+            return format_projects(result.get("values", []))
 
-        except Exception as e:
-            logger.error(f"Failed to get projects: {e}")
-            return f"Error: {str(e)}"
-
-    @mcp.tool()
+    @tool_if(mcp, config.is_tool_enabled("jira_get_project_issues"))
+    @tool_error_handler()
     async def jira_get_project_issues(
         project_key: str,
         max_results: int = 50,
@@ -95,32 +91,30 @@ def register_project_tools(mcp: FastMCP, client: JiraClient, config: JiraConfig)
             jira_get_project_issues("PROJ")
             jira_get_project_issues("PROJ", max_results=100)
         """
-        if not config.is_tool_enabled("jira_get_project_issues"):
-            return "Tool is disabled by configuration"
-
-        try:
-            logger.info(f"Getting issues for project: {project_key}")
-            result = await client.get_project_issues(project_key, max_results)
+        logger.info("Getting issues for project: %s", project_key)
+        result = await client.get_project_issues(project_key, max_results=max_results)
 
-            issues = result.get("issues", [])
-            total = result.get("total", 0)
+        issues = result.get("issues", [])
+        total = result.get("total", 0)
 
-            output = f"# Project {project_key} Issues\n\n**Total:** {total} issues (showing up to {max_results})\n\n"
+        header = (
+            f"# Project {project_key} Issues\n\n"
+            f"**Total:** {total} issues (showing up to {max_results})\n\n"
+        )
 
-            if not issues:
-                return output + "No issues found.\n"
+        if not issues:
+            return header + "No issues found.\n"
 
-            for issue in issues:
-                fields = issue.get("fields", {})
-                key = issue.get("key", "N/A")
-                summary = fields.get("summary", "N/A")
-                status = fields.get("status", {}).get("name", "N/A")
-                issue_type = fields.get("issuetype", {}).get("name", "N/A")
+        parts = [header]
 
-                output += f"- **{key}**: {summary} [{issue_type} - {status}]\n"
+        # Never render more than requested, even if the server sends extra
+        for issue in islice(issues, max_results):
+            fields = issue.get("fields", {})
+            key = issue.get("key", "N/A")
+            summary = fields.get("summary", "N/A")
+            status = fields.get("status", {}).get("name", "N/A")
+            issue_type = fields.get("issuetype", {}).get("name", "N/A")
 
-            return output
+            parts.append(f"- **{key}**: {summary} [{issue_type} - {status}]\n")
 
-        except Exception as e:
-            logger.error(f"Failed to get project issues: {e}")
-            return f"Error: {str(e)}"
+        return "".join(parts)
@@ -1,11 +1,15 @@
 """Sprint operations for JIRA Agile."""
 
+from itertools import chain
 from typing import Any, Optional
 
 from fastmcp import FastMCP
 
 from jira_mcp.client import JiraClient
 from jira_mcp.config import JiraConfig
+from jira_mcp.tools._registry import tool_error_handler, tool_if
+from jira_mcp.utils.fields import nested_get
+from jira_mcp.utils.markdown import TABLE_CELL_ESCAPE
 
 
 def format_sprints(sprints: list[dict[str, Any]], board_id: Optional[int] = None) -> str:
@@ -42,6 +46,29 @@ def format_sprints(sprints: list[dict[str, Any]], board_id: Optional[int] = None
     return "\n".join(output)
 
 
+def _sprint_issue_row(issue: dict[str, Any]) -> str:
+    """Format one issue as a sprint table row."""
+    fields = issue.get('fields') or {}
+    summary = fields.get('summary', 'N/A')
+    issue_type = nested_get(fields, 'issuetype', 'name', 'N/A')
+    status = nested_get(fields, 'status', 'name', 'N/A')
+    assignee = nested_get(fields, 'assignee', 'displayName', 'Unassigned')
+
+    # Story points can be in different custom fields
+    story_points = fields.get('customfield_10016') or fields.get('storyPoints', 'N/A')
+    if story_points and not isinstance(story_points, str):
+        story_points = str(story_points)
+
+    # Escape pipes and flatten newlines so the row stays intact
+    summary = summary.translate(TABLE_CELL_ESCAPE)
+    assignee = assignee.translate(TABLE_CELL_ESCAPE)
+
+    return (
+        f"| {issue.get('key', 'N/A')} | {summary} | {issue_type} | {status} "
+        f"| {assignee} | {story_points} |"
+    )
+
+
 def format_sprint_issues(
     issues: list[dict[str, Any]],
     sprint_name: str = "Sprint",
@@ -58,33 +85,31 @@ def format_sprint_issues(
     if not issues:
         return f"No issues found in {sprint_name}."
 
-    output = [f"# Issues in {sprint_name}\n"]
-    output.append(f"Total: {len(issues)} issue(s)\n")
-    output.append("| Key | Summary | Type | Status | Assignee | Story Points |")
-    output.append("|-----|---------|------|--------|----------|--------------|")
-
-    for issue in issues:
-        key = issue.get('key', 'N/A')
-        fields = issue.get('fields', {})
-        summary = fields.get('summary', 'N/A')
-        issue_type = fields.get('issuetype', {}).get('name', 'N/A')
-        status = fields.get('status', {}).get('name', 'N/A')
+    header = (
+        f"# Issues in {sprint_name}\n",
+        f"Total: {len(issues)} issue(s)\n",
+        "| Key | Summary | Type | Status | Assignee | Story Points |",
+        "|-----|---------|------|--------|----------|--------------|",
+    )
+    return "\n".join(chain(header, map(_sprint_issue_row, issues)))
 
-        assignee_data = fields.get('assignee')
-        assignee = assignee_data.get('displayName', 'Unassigned') if assignee_data else 'Unassigned'
 
-        # Story points can be in different custom fields
-        story_points = fields.get('customfield_10016') or fields.get('storyPoints', 'N/A')
-        if story_points and not isinstance(story_points, str):
-            story_points = str(story_points)
+def _sprint_details(sprint: dict[str, Any]) -> list[str]:
+    """List a single sprint's fields as markdown bullet lines."""
+    output = [
+        f"- **Name:** {sprint.get('name')}",
+        f"- **ID:** {sprint.get('id')}",
+        f"- **State:** {sprint.get('state', 'N/A')}",
+    ]
 
-        # Escape pipe characters
-        summary = summary.replace('|', '\\|')
-        assignee = assignee.replace('|', '\\|')
-
-        output.append(f"| {key} | {summary} | {issue_type} | {status} | {assignee} | {story_points} |")
+    if start_date := sprint.get('startDate'):
+        output.append(f"- **Start Date:** {start_date}")
+    if end_date := sprint.get('endDate'):
+        output.append(f"- **End Date:** {end_date}")
+    if goal := sprint.get('goal'):
+        output.append(f"- **Goal:** {goal}")
 
-    return "\n".join(output)
+    return output
 
 
 def format_sprint_created(sprint: dict[str, Any]) -> str:
@@ -96,19 +121,19 @@ def format_sprint_created(sprint: dict[str, Any]) -> str:
     Returns:
         Formatted markdown string
     """
-    output = [f"# Sprint Created Successfully\n"]
-    output.append(f"- **Name:** {sprint.get('name')}")
-    output.append(f"- **ID:** {sprint.get('id')}")
-    output.append(f"- **State:** {sprint.get('state', 'N/A')}")
+    return "\n".join(["# Sprint Created Successfully\n", *_sprint_details(sprint)])
 
-    if start_date := sprint.get('startDate'):
-        output.append(f"- **Start Date:** {start_date}")
-    if end_date := sprint.get('endDate'):
-        output.append(f"- **End Date:** {end_date}")
-    if goal := sprint.get('goal'):
-        output.append(f"- **Goal:** {goal}")
 
-    return "\n".join(output)
+def format_sprint_updated(sprint: dict[str, Any]) -> str:
+    """Format updated sprint information.
+
+    Args:
+        sprint: Sprint dictionary
+
+    Returns:
+        Formatted markdown string
+    """
+    return "\n".join(["# Sprint Updated Successfully\n", *_sprint_details(sprint)])
 
 
 def register_sprint_tools(mcp: FastMCP, client: JiraClient, config: JiraConfig) -> None:
@@ -120,7 +145,8 @@ def register_sprint_tools(mcp: FastMCP, client: JiraClient, config: JiraConfig)
         config: JIRA configuration
     """
 
-    @mcp.tool()
+    @tool_if(mcp, config.is_tool_enabled("jira_get_sprints_from_board"))
+    @tool_error_handler("retrieving sprints")
     async def jira_get_sprints_from_board(
         board_id: int,
         state: Optional[str] = None,
@@ -139,20 +165,15 @@ def register_sprint_tools(mcp: FastMCP, client: JiraClient, config: JiraConfig)
             - Get active sprints: jira_get_sprints_from_board(board_id=123, state="active")
             - Get future sprints: jira_get_sprints_from_board(board_id=123, state="future")
         """
-        if not config.is_tool_enabled("jira_get_sprints_from_board"):
-            return "Tool 'jira_get_sprints_from_board' is disabled by configuration."
-
-        try:
-            result = await client.get_sprints(
-                board_id=board_id,
-                state=state,
-            )
-            sprints = result.get("values", []) if isinstance(result, dict) else result
-            return format_sprints(sprints, board_id)
-        except Exception as e:
-            return f"Error retrieving sprints: {str(e)}"
-
-    @mcp.tool()
+        result = await client.get_sprints(
+            board_id=board_id,
+            state=state,
+        )
+        sprints = result.get("values", []) if isinstance(result, dict) else result
+        return format_sprints(sprints, board_id)
+
+    @tool_if(mcp, config.is_tool_enabled("jira_get_sprint_issues"))
+    @tool_error_handler("retrieving sprint issues")
     async def jira_get_sprint_issues(
         sprint_id: int,
         jql: Optional[str] = None,
@@ -173,30 +194,25 @@ def register_sprint_tools(mcp: FastMCP, client: JiraClient, config: JiraConfig)
             - Filter by type: jira_get_sprint_issues(sprint_id=456, jql="type = Story")
             - Limit results: jira_get_sprint_issues(sprint_id=456, max_results=20)
         """
-        if not config.is_tool_enabled("jira_get_sprint_issues"):
-            return "Tool 'jira_get_sprint_issues' is disabled by configuration."
-
         # Validate max_results
         if max_results > 100:
             max_results = 100
         elif max_results < 1:
             max_results = 1
 
-        try:
-            result = await client.get_sprint_issues(
-                sprint_id=sprint_id,
-                jql=jql,
-                max_results=max_results,
-            )
+        result = await client.get_sprint_issues(
+            sprint_id=sprint_id,
+            jql=jql,
+            max_results=max_results,
+        )
 
-            issues = result.get('issues', [])
-            sprint_name = result.get('sprint_name', f"Sprint {sprint_id}")
+        issues = result.get('issues', [])
+        sprint_name = result.get('sprint_name', f"Sprint {sprint_id}")
 
-            return format_sprint_issues(issues, sprint_name)
-        except Exception as e:
-            return f"Error retrieving sprint issues: {str(e)}"
+        return format_sprint_issues(issues, sprint_name)
 
-    @mcp.tool()
+    @tool_if(mcp, config.is_tool_enabled("jira_create_sprint") and not config.read_only)
+    @tool_error_handler("creating sprint")
     async def jira_create_sprint(
         name: str,
         board_id: int,
@@ -222,25 +238,17 @@ def register_sprint_tools(mcp: FastMCP, client: JiraClient, config: JiraConfig)
                 start_date="2025-01-01T09:00:00.000Z", end_date="2025-01-14T17:00:00.000Z")
             - With goal: jira_create_sprint(name="Sprint 10", board_id=123, goal="Complete feature X")
         """
-        if not config.is_tool_enabled("jira_create_sprint"):
-            return "Tool 'jira_create_sprint' is disabled by configuration."
-
-        if config.read_only:
-            return "Cannot create sprint: Server is in read-only mode."
-
-        try:
-            sprint = await client.create_sprint(
-                name=name,
-                board_id=board_id,
-                start_date=start_date,
-                end_date=end_date,
-                goal=goal,
-            )
-            return format_sprint_created(sprint)
-        except Exception as e:
-            return f"Error creating sprint: {str(e)}"
-
-    @mcp.tool()
+        sprint = await client.create_sprint(
+            name=name,
+            board_id=board_id,
+            start_date=start_date,
+            end_date=end_date,
+            goal=goal,
+        )
+        return format_sprint_created(sprint)
+
+    @tool_if(mcp, config.is_tool_enabled("jira_update_sprint") and not config.read_only)
+    @tool_error_handler("updating sprint")
     async def jira_update_sprint(
         sprint_id: int,
         name: Optional[str] = None,
@@ -269,25 +277,16 @@ def register_sprint_tools(mcp: FastMCP, client: JiraClient, config: JiraConfig)
                 goal="Bug fixes and polish")
             - Extend dates: jira_update_sprint(sprint_id=456, end_date="2025-01-21T17:00:00.000Z")
         """
-        if not config.is_tool_enabled("jira_update_sprint"):
-            return "Tool 'jira_update_sprint' is disabled by configuration."
-
-        if config.read_only:
-            return "Cannot update sprint: Server is in read-only mode."
-
         # Validate state if provided
         if state and state not in ['active', 'closed']:
             return f"Invalid state '{state}'. Must be 'active' or 'closed'."
 
-        try:
-            sprint = await client.update_sprint(
-                sprint_id=sprint_id,
-                name=name,
-                state=state,
-                start_date=start_date,
-                end_date=end_date,
-                goal=goal,
-            )
-            return f"Sprint updated successfully.\n\n{format_sprints([sprint])}"
-        except Exception as e:
-            return f"Error updating sprint: {str(e)}"
+        sprint = await client.update_sprint(
+            sprint_id=sprint_id,
+            name=name,
+            state=state,
+            start_date=start_date,
+            end_date=end_date,
+            goal=goal,
+        )
+        return format_sprint_updated(sprint)
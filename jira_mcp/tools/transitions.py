@@ -6,6 +6,8 @@ from fastmcp import FastMCP
 
 from jira_mcp.client import JiraClient
 from jira_mcp.config import JiraConfig
+from jira_mcp.tools._registry import tool_error_handler, tool_if
+from jira_mcp.utils.adf import text_to_adf
 from jira_mcp.utils.logging import get_logger
 
 
@@ -47,7 +49,8 @@ def register_transition_tools(
     """
     logger = get_logger()
 
-    @mcp.tool()
+    @tool_if(mcp, config.is_tool_enabled("jira_get_transitions"))
+    @tool_error_handler()
     async def jira_get_transitions(issue_key: str) -> str:
         """Get available workflow transitions for a JIRA issue.
 
@@ -63,18 +66,12 @@ def register_transition_tools(
         Example:
             jira_get_transitions("PROJ-123")
         """
-        if not config.is_tool_enabled("jira_get_transitions"):
-            return "Tool is disabled by configuration"
-
-        try:
-            logger.info(f"Getting transitions for issue: {issue_key}")
-            result = await client.get_transitions(issue_key)
-            return format_transitions(result)
-        except Exception as e:
-            logger.error(f"Failed to get transitions for {issue_key}: {e}")
-            return f"Error: {str(e)}"
-
-    @mcp.tool()
+        logger.info("Getting transitions for issue: %s", issue_key)
+        result = await client.get_transitions(issue_key)
+        return format_transitions(result)
+
+    @tool_if(mcp, config.is_tool_enabled("jira_transition_issue") and not config.read_only)
+    @tool_error_handler()
     async def jira_transition_issue(
         issue_key: str,
         transition_name: str,
@@ -99,64 +96,48 @@ def register_transition_tools(
             jira_transition_issue("PROJ-123", "Start Progress")
             jira_transition_issue("PROJ-123", "Done", resolution="Fixed", comment="Bug fixed")
         """
-        if not config.is_tool_enabled("jira_transition_issue"):
-            return "Tool is disabled by configuration"
-
-        if config.read_only:
-            return "Error: Cannot transition issue - server is in read-only mode"
-
-        try:
-            logger.info(f"Transitioning issue {issue_key} to: {transition_name}")
-
-            # First, get available transitions to find the ID
-            transitions_data = await client.get_transitions(issue_key)
-            transitions = transitions_data.get("transitions", [])
-
-            # Find the transition ID by name
-            transition_id = None
-            for transition in transitions:
-                if transition.get("name", "").lower() == transition_name.lower():
-                    transition_id = transition.get("id")
-                    break
-
-            if not transition_id:
-                available = [t.get("name", "N/A") for t in transitions]
-                return f"Error: Transition '{transition_name}' not found. Available transitions: {', '.join(available)}"
-
-            # Build fields for transition
-            fields = {}
-            if resolution:
-                fields["resolution"] = {"name": resolution}
-
-            # Execute transition
-            await client.transition_issue(issue_key, transition_id, fields if fields else None)
-
-            # Add comment if provided
-            comment_msg = ""
-            if comment:
-                adf_body = {
-                    "type": "doc",
-                    "version": 1,
-                    "content": [
-                        {
-                            "type": "paragraph",
-                            "content": [{"type": "text", "text": comment}],
-                        }
-                    ],
-                }
-                await client.add_comment(issue_key, adf_body)
-                comment_msg = "\n✅ Comment added"
-
-            # Get updated issue to show new status
+        logger.info("Transitioning issue %s to: %s", issue_key, transition_name)
+
+        # First, get available transitions to find the ID
+        transitions_data = await client.get_transitions(issue_key)
+        transitions = transitions_data.get("transitions", [])
+
+        # Find the transition by name
+        wanted = transition_name.lower()
+        match = next(
+            (t for t in transitions if t.get("name", "").lower() == wanted),
+            {},
+        )
+        transition_id = match.get("id")
+
+        if not transition_id:
+            available = [t.get("name", "N/A") for t in transitions]
+            return f"Error: Transition '{transition_name}' not found. Available transitions: {', '.join(available)}"
+
+        # Build fields for transition
+        fields = {}
+        if resolution:
+            fields["resolution"] = {"name": resolution}
+
+        # The comment rides in the transition request itself, so it is only
+        # added if the transition succeeds
+        await client.transition_issue(
+            issue_key,
+            transition_id,
+            fields or None,
+            comment=text_to_adf(comment) if comment else None,
+        )
+        comment_msg = "\n✅ Comment added" if comment else ""
+
+        # The transition names its target status; only fetch the issue if it doesn't
+        new_status = (match.get("to") or {}).get("name")
+        if not new_status:
             updated_issue = await client.get_issue(issue_key)
             new_status = updated_issue.get("fields", {}).get("status", {}).get("name", "N/A")
 
-            return f"""✅ Issue transitioned successfully!
+        return f"""✅ Issue transitioned successfully!
 
 **Issue:** {issue_key}
 **Transition:** {transition_name}
 **New Status:** {new_status}{comment_msg}
 """
-        except Exception as e:
-            logger.error(f"Failed to transition issue {issue_key}: {e}")
-            return f"Error: {str(e)}"
@@ -6,6 +6,7 @@ from fastmcp import FastMCP
 
 from jira_mcp.client import JiraClient
 from jira_mcp.config import JiraConfig
+from jira_mcp.tools._registry import tool_error_handler, tool_if
 
 
 def format_user_profile(data: dict[str, Any]) -> str:
@@ -42,17 +43,15 @@ def format_user_profile(data: dict[str, Any]) -> str:
 """
 
 
-def format_user_search_results(data: dict[str, Any]) -> str:
+def format_user_search_results(users: list[dict[str, Any]]) -> str:
     """Format user search results into readable markdown.
 
     Args:
-        data: User search data from API
+        users: List of user data from API
 
     Returns:
         Formatted markdown string
     """
-    users = data.get("users", [])
-
     if not users:
         return "No users found matching the search query."
 
@@ -81,7 +80,8 @@ def register_user_tools(mcp: FastMCP, client: JiraClient, config: JiraConfig) ->
         config: JIRA configuration
     """
 
-    @mcp.tool()
+    @tool_if(mcp, config.is_tool_enabled("jira_get_user_profile"))
+    @tool_error_handler("retrieving user profile")
     async def jira_get_user_profile(account_id: str = "") -> str:
         """Get JIRA user profile information.
 
@@ -98,15 +98,13 @@ def register_user_tools(mcp: FastMCP, client: JiraClient, config: JiraConfig) ->
             jira_get_user_profile()  # Get current user
             jira_get_user_profile("5b10ac8d82e05b22cc7d4ef5")  # Get specific user
         """
-        if not config.is_tool_enabled("jira_get_user_profile"):
-            return "Tool is disabled by configuration"
-
         result = await client.get_user_profile(
             account_id=account_id if account_id else None
         )
         return format_user_profile(result)
 
-    @mcp.tool()
+    @tool_if(mcp, config.is_tool_enabled("jira_search_users"))
+    @tool_error_handler("searching users")
     async def jira_search_users(
         query: str,
         max_results: int = 50,
@@ -128,9 +126,6 @@ def register_user_tools(mcp: FastMCP, client: JiraClient, config: JiraConfig) ->
             jira_search_users("john.doe@example.com")
             jira_search_users("smith", max_results=10)
         """
-        if not config.is_tool_enabled("jira_search_users"):
-            return "Tool is disabled by configuration"
-
         result = await client.search_users(
             query=query,
             max_results=max_results,
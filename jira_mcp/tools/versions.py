@@ -6,6 +6,7 @@ from fastmcp import FastMCP
 
 from jira_mcp.client import JiraClient
 from jira_mcp.config import JiraConfig
+from jira_mcp.tools._registry import tool_error_handler, tool_if
 
 
 def format_versions(data: dict[str, Any]) -> str:
@@ -79,11 +80,10 @@ def format_batch_versions(data: dict[str, Any]) -> str:
         return "No versions were created."
 
     lines = [f"# {len(versions)} Versions Created\n"]
-
-    for version in versions:
-        name = version.get("name", "Unknown")
-        version_id = version.get("id", "N/A")
-        lines.append(f"- **{name}** (ID: {version_id})")
+    lines += [
+        f"- **{version.get('name', 'Unknown')}** (ID: {version.get('id', 'N/A')})"
+        for version in versions
+    ]
 
     return "\n".join(lines)
 
@@ -97,7 +97,8 @@ def register_version_tools(mcp: FastMCP, client: JiraClient, config: JiraConfig)
         config: JIRA configuration
     """
 
-    @mcp.tool()
+    @tool_if(mcp, config.is_tool_enabled("jira_get_project_versions"))
+    @tool_error_handler("retrieving versions")
     async def jira_get_project_versions(project_key: str) -> str:
         """Get all versions for a JIRA project.
 
@@ -113,13 +114,11 @@ def register_version_tools(mcp: FastMCP, client: JiraClient, config: JiraConfig)
         Example:
             jira_get_project_versions("PROJ")
         """
-        if not config.is_tool_enabled("jira_get_project_versions"):
-            return "Tool is disabled by configuration"
-
         result = await client.get_project_versions(project_key)
         return format_versions(result)
 
-    @mcp.tool()
+    @tool_if(mcp, config.is_tool_enabled("jira_create_version") and not config.read_only)
+    @tool_error_handler("creating version")
     async def jira_create_version(
         project_key: str,
         name: str,
@@ -151,12 +150,6 @@ def register_version_tools(mcp: FastMCP, client: JiraClient, config: JiraConfig)
             jira_create_version("PROJ", "v1.0.0", "First major release", "2024-12-31")
             jira_create_version("PROJ", "Sprint 23", start_date="2024-01-01", release_date="2024-01-14")
         """
-        if not config.is_tool_enabled("jira_create_version"):
-            return "Tool is disabled by configuration"
-
-        if config.read_only:
-            return "Operation not allowed: Server is in read-only mode"
-
         result = await client.create_version(
             project_key=project_key,
             name=name,
@@ -168,7 +161,8 @@ def register_version_tools(mcp: FastMCP, client: JiraClient, config: JiraConfig)
         )
         return format_version_created(result)
 
-    @mcp.tool()
+    @tool_if(mcp, config.is_tool_enabled("jira_batch_create_versions") and not config.read_only)
+    @tool_error_handler("creating versions")
     async def jira_batch_create_versions(
         project_key: str,
         version_names: list[str],
@@ -188,12 +182,6 @@ def register_version_tools(mcp: FastMCP, client: JiraClient, config: JiraConfig)
         Example:
             jira_batch_create_versions("PROJ", ["v1.0.0", "v1.1.0", "v2.0.0"])
         """
-        if not config.is_tool_enabled("jira_batch_create_versions"):
-            return "Tool is disabled by configuration"
-
-        if config.read_only:
-            return "Operation not allowed: Server is in read-only mode"
-
         # Convert version names to version data dictionaries
         versions = [{"name": name} for name in version_names]
 
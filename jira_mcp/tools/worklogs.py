@@ -6,6 +6,7 @@ from fastmcp import FastMCP
 
 from jira_mcp.client import JiraClient
 from jira_mcp.config import JiraConfig
+from jira_mcp.tools._registry import tool_error_handler, tool_if
 
 
 def format_worklog_entry(data: dict[str, Any]) -> str:
@@ -47,7 +48,7 @@ def format_worklogs(data: dict[str, Any]) -> str:
     if not worklogs:
         return "No worklogs found for this issue."
 
-    lines = ["# Worklogs\n"]
+    body = []
     total_seconds = 0
 
     for worklog in worklogs:
@@ -59,18 +60,18 @@ def format_worklogs(data: dict[str, Any]) -> str:
 
         total_seconds += time_seconds
 
-        lines.append(f"## {author} - {time_spent}")
-        lines.append(f"- **Started:** {started}")
-        lines.append(f"- **Comment:** {comment}\n")
+        body.append(f"## {author} - {time_spent}")
+        body.append(f"- **Started:** {started}")
+        body.append(f"- **Comment:** {comment}\n")
 
     # Calculate total time
-    hours = total_seconds // 3600
-    minutes = (total_seconds % 3600) // 60
+    hours, remainder = divmod(total_seconds, 3600)
+    minutes = remainder // 60
     total_time = f"{hours}h {minutes}m" if hours > 0 else f"{minutes}m"
 
-    lines.insert(1, f"**Total Time Logged:** {total_time}\n")
-
-    return "\n".join(lines)
+    # The total is only known after the loop, so the header is joined on last
+    header = f"# Worklogs\n\n**Total Time Logged:** {total_time}\n\n"
+    return header + "\n".join(body)
 
 
 def register_worklog_tools(mcp: FastMCP, client: JiraClient, config: JiraConfig) -> None:
@@ -82,7 +83,8 @@ def register_worklog_tools(mcp: FastMCP, client: JiraClient, config: JiraConfig)
         config: JIRA configuration
     """
 
-    @mcp.tool()
+    @tool_if(mcp, config.is_tool_enabled("jira_add_worklog") and not config.read_only)
+    @tool_error_handler("adding worklog")
     async def jira_add_worklog(
         issue_key: str,
         time_spent: str,
@@ -107,12 +109,6 @@ def register_worklog_tools(mcp: FastMCP, client: JiraClient, config: JiraConfig)
             jira_add_worklog("PROJ-123", "2h 30m", "Implemented new feature")
             jira_add_worklog("PROJ-456", "1d", "Code review and testing")
         """
-        if not config.is_tool_enabled("jira_add_worklog"):
-            return "Tool is disabled by configuration"
-
-        if config.read_only:
-            return "Operation not allowed: Server is in read-only mode"
-
         result = await client.add_worklog(
             issue_key=issue_key,
             time_spent=time_spent,
@@ -121,7 +117,8 @@ def register_worklog_tools(mcp: FastMCP, client: JiraClient, config: JiraConfig)
         )
         return format_worklog_entry(result)
 
-    @mcp.tool()
+    @tool_if(mcp, config.is_tool_enabled("jira_get_worklog"))
+    @tool_error_handler("retrieving worklogs")
     async def jira_get_worklog(issue_key: str) -> str:
         """Get all worklog entries for a JIRA issue.
 
@@ -137,8 +134,5 @@ def register_worklog_tools(mcp: FastMCP, client: JiraClient, config: JiraConfig)
         Example:
             jira_get_worklog("PROJ-123")
         """
-        if not config.is_tool_enabled("jira_get_worklog"):
-            return "Tool is disabled by configuration"
-
         result = await client.get_worklog(issue_key)
         return format_worklogs(result)
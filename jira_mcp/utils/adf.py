@@ -0,0 +1,73 @@
+"""Helpers for Atlassian Document Format (ADF) content."""
+
+from typing import Any
+
+# Node types that start a new block of text
+_BLOCK_TYPES = frozenset(
+    {
+        "paragraph",
+        "heading",
+        "blockquote",
+        "codeBlock",
+        "listItem",
+        "panel",
+        "rule",
+        "tableCell",
+        "tableHeader",
+    }
+)
+
+_BLOCK_SEPARATOR = "\n\n"
+
+
+def adf_to_text(adf: Any) -> str:
+    """Extract plain text from an ADF document.
+
+    Walks the whole node tree iteratively, so text inside headings, lists,
+    tables and other nested nodes is kept, and joins the fragments once.
+
+    Args:
+        adf: ADF document structure
+
+    Returns:
+        Extracted text, with blocks separated by blank lines
+    """
+    if not isinstance(adf, dict):
+        return str(adf)
+
+    parts: list[str] = []
+    stack: list[Any] = [adf]
+    while stack:
+        node = stack.pop()
+        if not isinstance(node, dict):
+            continue
+
+        node_type = node.get("type")
+        if node_type == "text":
+            parts.append(node.get("text", ""))
+        elif node_type == "hardBreak":
+            parts.append("\n")
+        elif node_type in _BLOCK_TYPES and parts and parts[-1] != _BLOCK_SEPARATOR:
+            parts.append(_BLOCK_SEPARATOR)
+
+        content = node.get("content")
+        if content:
+            stack.extend(reversed(content))
+
+    return "".join(parts).strip()
+
+
+def text_to_adf(text: str) -> dict[str, Any]:
+    """Wrap plain text in a single-paragraph ADF document.
+
+    Args:
+        text: Plain text content
+
+    Returns:
+        ADF document structure
+    """
+    return {
+        "type": "doc",
+        "version": 1,
+        "content": [{"type": "paragraph", "content": [{"type": "text", "text": text}]}],
+    }
@@ -0,0 +1,22 @@
+"""Helpers for reading JIRA issue field values."""
+
+from typing import Any, Mapping
+
+
+def nested_get(data: Mapping[str, Any], key: str, subkey: str, default: Any) -> Any:
+    """Read ``data[key][subkey]`` without allocating a fallback dict.
+
+    JIRA returns null for unset object fields (assignee, resolution, ...), so
+    a missing or null ``key`` yields ``default``, as does a missing ``subkey``.
+
+    Args:
+        data: Mapping to read from (e.g. an issue's ``fields``)
+        key: Outer key
+        subkey: Key within the nested object
+        default: Value returned when either level is missing
+
+    Returns:
+        The nested value, or ``default``
+    """
+    inner = data.get(key)
+    return inner.get(subkey, default) if inner else default
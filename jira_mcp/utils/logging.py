@@ -2,21 +2,30 @@
 
 import logging
 import sys
-from functools import lru_cache
 from typing import Optional
 
+# Level applied by the last configure_logging() call
+_configured_level: Optional[str] = None
+
+# Loggers already returned by get_logger, by name
+_loggers: dict[str, logging.Logger] = {}
+
 
-@lru_cache
 def get_logger(name: str = "jira_mcp", level: Optional[str] = None) -> logging.Logger:
     """Get a configured logger instance.
 
     Args:
         name: Logger name
-        level: Log level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
+        level: Log level (DEBUG, INFO, WARNING, ERROR, CRITICAL), applied only
+            when the logger is first set up; use configure_logging() to change it
 
     Returns:
         Configured logger instance
     """
+    logger = _loggers.get(name)
+    if logger is not None:
+        return logger
+
     logger = logging.getLogger(name)
 
     # Only configure if not already configured
@@ -40,6 +49,7 @@ def get_logger(name: str = "jira_mcp", level: Optional[str] = None) -> logging.L
         # Prevent propagation to root logger
         logger.propagate = False
 
+    _loggers[name] = logger
     return logger
 
 
@@ -49,11 +59,18 @@ def configure_logging(level: str = "INFO") -> None:
     Args:
         level: Log level to set
     """
-    # Clear the cache to allow reconfiguration
-    get_logger.cache_clear()
+    global _configured_level
 
-    # Configure root jira_mcp logger
-    get_logger("jira_mcp", level)
+    if level == _configured_level:
+        return
+    _configured_level = level
+
+    # Configure root jira_mcp logger, re-levelling it if it was already set up
+    logger = get_logger("jira_mcp", level)
+    log_level = getattr(logging, level)
+    logger.setLevel(log_level)
+    for handler in logger.handlers:
+        handler.setLevel(log_level)
 
     # Reduce noise from httpx
     logging.getLogger("httpx").setLevel(logging.WARNING)
@@ -0,0 +1,5 @@
+"""Helpers for rendering markdown output."""
+
+# Escapes table-cell delimiters and flattens line breaks, which would
+# otherwise end the table row
+TABLE_CELL_ESCAPE = str.maketrans({"|": "\\|", "\n": " ", "\r": ""})
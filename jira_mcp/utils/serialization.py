@@ -0,0 +1,37 @@
+"""JSON encoding/decoding with an optional orjson fast path."""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None  # type: ignore[assignment]
+
+
+def json_loads(data: Union[bytes, str]) -> Any:
+    """Decode JSON, using orjson when available.
+
+    Args:
+        data: JSON document as bytes or str
+
+    Returns:
+        Decoded Python object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj: Any) -> bytes:
+    """Encode an object as compact UTF-8 JSON, using orjson when available.
+
+    Args:
+        obj: JSON-serializable object
+
+    Returns:
+        Encoded JSON bytes
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode()
@@ -17,10 +17,17 @@ def mock_config():
     config.read_only = False
     config.enabled_tools = None
     config.enabled_tools_list = []
+    config.enabled_tools_set = frozenset()
     config.log_level = "INFO"
     config.timeout = 30
     config.verify_ssl = True
     config.max_retries = 3
+    config.http2 = True
+    config.max_connections = 100
+    config.max_keepalive_connections = 50
+    config.keepalive_expiry = 60.0
+    config.epic_link_field = "customfield_10014"
+    config.metadata_cache_ttl = 300.0
     config.is_cloud = True
     config.use_pat = False
     config.is_tool_enabled = MagicMock(return_value=True)
@@ -0,0 +1,205 @@
+"""Tests for JiraClient request handling, caching and pagination."""
+
+import asyncio
+from types import SimpleNamespace
+
+import httpx
+import pytest
+import respx
+
+from jira_mcp.client import jira_client
+from jira_mcp.client.jira_client import JiraClient, JiraRateLimitError
+
+BASE_URL = "https://test.atlassian.net"
+
+
+@pytest.fixture
+async def client(mock_config):
+    """JiraClient built from the mock config, closed after the test."""
+    client = JiraClient(mock_config)
+    yield client
+    await client.close()
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Record backoff sleeps instead of waiting."""
+    delays: list[float] = []
+
+    async def fake_sleep(delay: float) -> None:
+        delays.append(delay)
+
+    monkeypatch.setattr(jira_client.asyncio, "sleep", fake_sleep)
+    return delays
+
+
+# ================== Connection pool ==================
+
+
+async def test_clients_on_one_loop_share_a_pool_until_close_all(mock_config):
+    first, second = JiraClient(mock_config), JiraClient(mock_config)
+    pool = first.client
+
+    assert second.client is pool
+
+    await first.close()
+    await JiraClient.close_all()
+    assert pool.is_closed
+    assert second.client is not pool
+    await JiraClient.close_all()
+
+
+def test_client_outside_event_loop(mock_config):
+    client = JiraClient(mock_config)
+
+    assert isinstance(client.client, httpx.AsyncClient)
+
+
+# ================== Retries ==================
+
+
+@respx.mock(base_url=BASE_URL)
+async def test_429_waits_for_retry_after(respx_mock, client, sleeps):
+    route = respx_mock.get("/rest/api/2/issue/TEST-1").mock(
+        side_effect=[
+            httpx.Response(429, headers={"Retry-After": "45"}),
+            httpx.Response(200, json={"key": "TEST-1"}),
+        ]
+    )
+
+    result = await client.get_issue("TEST-1")
+
+    assert result == {"key": "TEST-1"}
+    assert route.call_count == 2
+    assert sleeps == [45.0]
+
+
+@respx.mock(base_url=BASE_URL)
+async def test_429_gives_up_when_retry_after_too_long(respx_mock, client, sleeps):
+    route = respx_mock.get("/rest/api/2/issue/TEST-1").mock(
+        return_value=httpx.Response(429, headers={"Retry-After": "120"})
+    )
+
+    with pytest.raises(JiraRateLimitError):
+        await client.get_issue("TEST-1")
+
+    assert route.call_count == 1
+    assert sleeps == []
+
+
+# ================== Caching ==================
+
+
+@respx.mock(base_url=BASE_URL)
+async def test_etag_304_reuses_cached_body(respx_mock, client):
+    route = respx_mock.get("/rest/api/2/issue/TEST-1").mock(
+        side_effect=[
+            httpx.Response(200, json={"key": "TEST-1", "fields": {}}, headers={"ETag": '"v1"'}),
+            httpx.Response(304),
+        ]
+    )
+
+    first = await client.get_issue("TEST-1")
+    first["fields"]["summary"] = "mutated by caller"
+    second = await client.get_issue("TEST-1")
+
+    assert route.calls[1].request.headers["If-None-Match"] == '"v1"'
+    assert second == {"key": "TEST-1", "fields": {}}
+
+
+@respx.mock(base_url=BASE_URL)
+async def test_ttl_cache_expires(respx_mock, client, monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr(jira_client, "time", SimpleNamespace(monotonic=lambda: clock[0]))
+    route = respx_mock.get("/rest/api/2/field").mock(
+        return_value=httpx.Response(200, json=[{"id": "summary", "name": "Summary"}])
+    )
+
+    await client.get_fields()
+    clock[0] += 299
+    await client.get_fields()
+    assert route.call_count == 1
+
+    clock[0] += 2
+    await client.get_fields()
+    assert route.call_count == 2
+
+
+@respx.mock(base_url=BASE_URL)
+async def test_invalidate_metadata_by_url_keeps_other_entries(respx_mock, client):
+    fields = respx_mock.get("/rest/api/2/field").mock(return_value=httpx.Response(200, json=[]))
+    current_user = respx_mock.get("/rest/api/2/myself").mock(
+        return_value=httpx.Response(200, json={"accountId": "abc"})
+    )
+    await client.get_fields()
+    await client.get_current_user()
+
+    client.invalidate_metadata(url="/rest/api/2/field")
+    await client.get_fields()
+    await client.get_current_user()
+
+    assert fields.call_count == 2
+    assert current_user.call_count == 1
+
+
+@respx.mock(base_url=BASE_URL)
+async def test_concurrent_gets_share_one_request(respx_mock, client):
+    route = respx_mock.get("/rest/api/2/issue/TEST-1/comment").mock(
+        return_value=httpx.Response(200, json={"comments": [], "total": 0})
+    )
+
+    first, second = await asyncio.gather(
+        client.get_comments("TEST-1"), client.get_comments("TEST-1")
+    )
+
+    assert route.call_count == 1
+    assert first == second == {"comments": [], "total": 0}
+
+    first["total"] = 99
+    assert second["total"] == 0
+
+
+# ================== Search pagination ==================
+
+
+def _issues(start: int, count: int) -> list[dict]:
+    return [{"key": f"TEST-{n}"} for n in range(start, start + count)]
+
+
+@respx.mock(base_url=BASE_URL)
+async def test_search_paged_server_fetches_remaining_pages_by_offset(respx_mock, mock_config):
+    mock_config.is_cloud = False
+
+    def page(request: httpx.Request) -> httpx.Response:
+        start = int(request.url.params["startAt"])
+        # The server caps pages at 2 issues, whatever maxResults asks for
+        return httpx.Response(
+            200, json={"issues": _issues(start, min(2, 5 - start)), "total": 5, "startAt": start}
+        )
+
+    route = respx_mock.get("/rest/api/2/search").mock(side_effect=page)
+    client = JiraClient(mock_config)
+    try:
+        result = await client.search_issues_paged("project = TEST", max_results=5)
+    finally:
+        await client.close()
+
+    assert [i["key"] for i in result["issues"]] == [f"TEST-{n}" for n in range(5)]
+    assert sorted(int(c.request.url.params["startAt"]) for c in route.calls) == [0, 2, 4]
+
+
+@respx.mock(base_url=BASE_URL)
+async def test_search_paged_cloud_follows_page_tokens(respx_mock, client):
+    route = respx_mock.get("/rest/api/3/search/jql").mock(
+        side_effect=[
+            httpx.Response(200, json={"issues": _issues(0, 2), "nextPageToken": "t1", "isLast": False}),
+            httpx.Response(200, json={"issues": _issues(2, 1), "isLast": True}),
+        ]
+    )
+
+    result = await client.search_issues_paged("project = TEST", max_results=5)
+
+    assert [i["key"] for i in result["issues"]] == ["TEST-0", "TEST-1", "TEST-2"]
+    assert route.call_count == 2
+    assert route.calls[1].request.url.params["nextPageToken"] == "t1"
+
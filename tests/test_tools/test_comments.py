@@ -0,0 +1,24 @@
+"""Tests for the comment tools."""
+
+from jira_mcp.tools.comments import format_comments
+
+
+def test_format_comments_handles_string_and_adf_bodies():
+    adf = {
+        "type": "doc",
+        "version": 1,
+        "content": [{"type": "paragraph", "content": [{"type": "text", "text": "ADF body"}]}],
+    }
+    result = format_comments(
+        {
+            "comments": [
+                {"author": {"displayName": "Ann"}, "created": "2024-01-01", "body": "Plain body"},
+                {"author": {"displayName": "Bob"}, "created": "2024-01-02", "body": adf},
+            ],
+            "total": 2,
+        }
+    )
+
+    assert "Plain body" in result
+    assert "ADF body" in result
+    assert "{'type'" not in result
@@ -0,0 +1,50 @@
+"""Tests for the user tools."""
+
+import httpx
+import pytest
+import respx
+from fastmcp import Client, FastMCP
+
+from jira_mcp.client import JiraClient
+from jira_mcp.tools.users import format_user_search_results, register_user_tools
+
+
+@pytest.fixture
+async def user_server(mock_config):
+    """FastMCP server with the user tools registered against a real client."""
+    client = JiraClient(mock_config)
+    mcp = FastMCP("test")
+    register_user_tools(mcp, client, mock_config)
+    yield mcp
+    await client.close()
+
+
+def test_format_user_search_results_empty():
+    assert format_user_search_results([]) == "No users found matching the search query."
+
+
+@respx.mock(base_url="https://test.atlassian.net")
+async def test_search_users_end_to_end(respx_mock, user_server):
+    route = respx_mock.get("/rest/api/2/user/search").mock(
+        return_value=httpx.Response(
+            200,
+            json=[
+                {
+                    "accountId": "abc123",
+                    "displayName": "John Doe",
+                    "emailAddress": "john@example.com",
+                    "active": True,
+                }
+            ],
+        )
+    )
+
+    async with Client(user_server) as mcp_client:
+        result = await mcp_client.call_tool("jira_search_users", {"query": "john", "max_results": 5})
+
+    text = result.content[0].text
+    assert "# User Search Results (1 found)" in text
+    assert "## John Doe" in text
+    assert "- **Account ID:** abc123" in text
+    assert route.calls.last.request.url.params["query"] == "john"
+    assert route.calls.last.request.url.params["maxResults"] == "5"
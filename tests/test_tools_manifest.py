@@ -0,0 +1,27 @@
+"""Tests keeping the static tool manifest in sync with the registered tools."""
+
+from fastmcp import FastMCP
+
+from jira_mcp._tools_manifest import TOOL_INFO, WRITE_TOOLS
+from jira_mcp.tools import register_all_tools
+
+
+async def _registered_tools(client, config) -> set[str]:
+    mcp = FastMCP("test")
+    register_all_tools(mcp, client, config)
+    return set(await mcp.get_tools())
+
+
+async def test_tool_info_lists_every_registered_tool(mock_client, mock_config):
+    listed = [name for _, tools in TOOL_INFO for name, _ in tools]
+
+    assert len(listed) == len(set(listed))
+    assert set(listed) == await _registered_tools(mock_client, mock_config)
+
+
+async def test_write_tools_are_the_ones_read_only_mode_drops(mock_client, mock_config):
+    all_tools = await _registered_tools(mock_client, mock_config)
+    mock_config.read_only = True
+    read_tools = await _registered_tools(mock_client, mock_config)
+
+    assert WRITE_TOOLS == all_tools - read_tools